@@ -69,7 +69,7 @@ def add_common_processing_options(parser: argparse.ArgumentParser):
         type=int,
         default=1,
         metavar="N",
-        help="Number of CPU cores (-1 for all, default: 1)",
+        help="Number of CPU cores (-1 for all, 0 to run in-process, default: 1)",
     )
     parser.add_argument(
         "--smiles-column",
@@ -71,7 +71,7 @@ def register_parser(subparsers):
         type=float,
         default=None,
         metavar="KCAL",
-        help="Keep only conformers within N kcal/mol of lowest energy",
+        help="Keep only optimized conformers within N kcal/mol of lowest energy",
     )
     gen_parser.add_argument(
         "--add-hydrogens",
@@ -205,6 +205,8 @@ def run_generate(args) -> int:
         optimize=not args.no_optimize,
         force_field=args.force_field,
         random_seed=args.seed,
+        prune_rms=args.prune_rms,
+        energy_window=args.energy_window,
     )
 
     input_path = Path(args.input)
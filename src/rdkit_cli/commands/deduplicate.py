@@ -22,7 +22,8 @@ def register_parser(subparsers):
         "-b", "--by",
         choices=["smiles", "inchi", "inchikey", "scaffold"],
         default="smiles",
-        help="Deduplication key type (default: smiles)",
+        help="Deduplication key type (default: smiles, the fastest; "
+        "inchi and inchikey also merge mobile-H tautomers)",
     )
     parser.add_argument(
         "--keep",
@@ -41,6 +42,8 @@ def register_parser(subparsers):
 
 def run_deduplicate(args) -> int:
     """Run the deduplicate command."""
+    from itertools import chain
+
     from rdkit_cli.core.deduplicate import Deduplicator
     from rdkit_cli.io import create_reader, create_writer
     from rdkit_cli.progress.ninja import NinjaProgress
@@ -48,9 +51,9 @@ def run_deduplicate(args) -> int:
     # Handle --list-keys
     if args.list_keys:
         print("Available deduplication keys:")
-        print("  smiles    - Canonical SMILES (default)")
-        print("  inchi     - InChI string")
-        print("  inchikey  - InChIKey (27 character hash)")
+        print("  smiles    - Canonical SMILES (default, fastest)")
+        print("  inchi     - InChI string (merges mobile-H tautomers)")
+        print("  inchikey  - InChIKey (27 character hash, merges mobile-H tautomers)")
         print("  scaffold  - Murcko scaffold SMILES")
         return 0
 
@@ -67,56 +70,61 @@ def run_deduplicate(args) -> int:
         has_header=not args.no_header,
     )
 
-    # Read all records with progress
-    if not args.quiet:
-        print("Reading molecules...", file=sys.stderr)
-
-    records = []
-    with reader:
-        total = len(reader)
-        progress = NinjaProgress(total=total, quiet=args.quiet)
-        progress.start()
-
-        for record in reader:
-            records.append(record)
-            progress.update(1)
-
-        progress.finish()
-
-    if not records:
-        print("Error: No molecules found in input file", file=sys.stderr)
-        return 1
-
-    if not args.quiet:
-        print(f"Deduplicating {len(records)} molecules by {args.by}...", file=sys.stderr)
-
-    # Create deduplicator
     deduplicator = Deduplicator(
         key_type=args.by,
         keep=args.keep,
     )
 
-    # Deduplicate
-    unique_records, n_duplicates = deduplicator.deduplicate(records)
+    if not args.quiet:
+        print(f"Deduplicating molecules by {args.by}...", file=sys.stderr)
 
-    # Write output
     output_path = Path(args.output)
-    writer = create_writer(output_path)
-
-    with writer:
-        for record in unique_records:
-            row = {"smiles": record.smiles}
-            if record.name:
-                row["name"] = record.name
-            for key, value in record.metadata.items():
-                if key not in row and key != "smiles":
-                    row[key] = value
-            writer.write_row(row)
+    n_read = 0
+    n_unique = 0
+
+    with reader:
+        progress = NinjaProgress(total=len(reader), quiet=args.quiet)
+        progress.start()
+
+        def read_records():
+            nonlocal n_read
+            for record in reader:
+                n_read += 1
+                progress.update(1)
+                yield record
+
+        if args.keep == "first":
+            # Duplicates are dropped as they are read, so the input is never held in memory
+            unique_records = deduplicator.deduplicate_stream(read_records())
+        else:
+            # Keeping the last occurrence needs the whole input first
+            unique_records, _ = deduplicator.deduplicate(list(read_records()))
+            unique_records = iter(unique_records)
+
+        # Every input record yields at least one output record
+        first = next(unique_records, None)
+        if first is None:
+            progress.finish()
+            print("Error: No molecules found in input file", file=sys.stderr)
+            return 1
+
+        with create_writer(output_path) as writer:
+            for record in chain([first], unique_records):
+                row = {"smiles": record.smiles}
+                if record.name:
+                    row["name"] = record.name
+                for key, value in record.metadata.items():
+                    if key not in row and key != "smiles":
+                        row[key] = value
+                writer.write_row(row)
+                n_unique += 1
+
+        progress.finish()
 
     if not args.quiet:
         print(
-            f"Removed {n_duplicates} duplicates. "
-            f"Wrote {len(unique_records)} unique molecules to {output_path}",
+            f"Removed {n_read - n_unique} duplicates. "
+            f"Wrote {n_unique} unique molecules to {output_path}",
             file=sys.stderr,
         )
 
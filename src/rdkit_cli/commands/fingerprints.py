@@ -74,7 +74,10 @@ def register_parser(subparsers):
         choices=["hex", "bitstring", "bits", "numpy"],
         default="hex",
         dest="output_format",
-        help="Output format (default: hex)",
+        help=(
+            "Output format (default: hex); numpy writes bit-packed uint8 rows to an .npz archive "
+            "and requires an output path ending in .npz"
+        ),
     )
     compute_parser.add_argument(
         "--use-chirality",
@@ -126,7 +129,10 @@ def run_compute(args) -> int:
     # Lazy imports
     from rdkit_cli.core.fingerprints import FingerprintCalculator, FingerprintType
     from rdkit_cli.io import create_reader, create_writer
-    from rdkit_cli.parallel.batch import process_molecules
+    from rdkit_cli.io.readers import SMIReader
+    from rdkit_cli.io.writers import NpzWriter
+    from rdkit_cli.parallel.batch import process_molecules, process_molecules_sharded
+    from rdkit_cli.parallel.executor import get_worker_count
 
     # Parse fingerprint type
     fp_type = FingerprintType(args.type)
@@ -157,14 +163,33 @@ def run_compute(args) -> int:
 
     # Create writer
     output_path = Path(args.output)
-    writer = create_writer(
-        output_path,
-        columns=calculator.get_column_names(),
-    )
+    if args.output_format == "numpy":
+        if output_path.suffix.lower() != ".npz":
+            print(
+                f"Error: --format numpy writes an .npz archive; use an output path ending in .npz "
+                f"(got {output_path})",
+                file=sys.stderr,
+            )
+            return 1
+        writer = NpzWriter(
+            output_path,
+            columns=calculator.get_column_names(),
+            attrs={"fp_type": args.type, "n_bits": calculator.n_bits},
+        )
+    else:
+        writer = create_writer(
+            output_path,
+            columns=calculator.get_column_names(),
+        )
+
+    # SMILES files are sharded by byte range so workers parse their own input
+    # while others compute fingerprints, instead of the parent parsing everything
+    sharded = isinstance(reader, SMIReader) and get_worker_count(args.ncpu) > 1
 
     # Process
     with reader, writer:
-        result = process_molecules(
+        process = process_molecules_sharded if sharded else process_molecules
+        result = process(
             reader=reader,
             writer=writer,
             processor=calculator.compute,
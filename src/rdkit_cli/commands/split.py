@@ -57,10 +57,28 @@ def register_parser(subparsers):
     parser.set_defaults(func=run_split)
 
 
+def _write_chunk(output_path: Path, chunk_records: list) -> None:
+    """Write one chunk of records to its own file."""
+    from rdkit_cli.io import create_writer
+
+    with create_writer(output_path) as writer:
+        for record in chunk_records:
+            row = {"smiles": record.smiles}
+            if record.name:
+                row["name"] = record.name
+            for key, value in record.metadata.items():
+                if key not in row and key != "smiles":
+                    row[key] = value
+            writer.write_row(row)
+
+
 def run_split(args) -> int:
     """Run the split command."""
+    from concurrent.futures import ThreadPoolExecutor
+
     from rdkit_cli.core.split import FileSplitter
-    from rdkit_cli.io import create_reader, create_writer, detect_format
+    from rdkit_cli.io import create_reader, detect_format
+    from rdkit_cli.parallel.executor import get_worker_count
     from rdkit_cli.progress.ninja import NinjaProgress
 
     input_path = Path(args.input)
@@ -119,29 +137,30 @@ def run_split(args) -> int:
     if not args.quiet:
         print(f"Splitting {len(records)} molecules into {n_chunks} files...", file=sys.stderr)
 
-    # Split and write
-    files_written = 0
-    for chunk_idx, chunk_records in splitter.split_records(records):
-        output_path = FileSplitter.generate_output_path(
-            output_dir=output_dir,
-            base_name=prefix,
-            chunk_idx=chunk_idx,
-            extension=out_format,
-            total_chunks=n_chunks,
+    # Chunk files are independent, so with -n > 1 they are written concurrently
+    chunks = [
+        (
+            FileSplitter.generate_output_path(
+                output_dir=output_dir,
+                base_name=prefix,
+                chunk_idx=chunk_idx,
+                extension=out_format,
+                total_chunks=n_chunks,
+            ),
+            chunk_records,
         )
-
-        writer = create_writer(output_path)
-        with writer:
-            for record in chunk_records:
-                row = {"smiles": record.smiles}
-                if record.name:
-                    row["name"] = record.name
-                for key, value in record.metadata.items():
-                    if key not in row and key != "smiles":
-                        row[key] = value
-                writer.write_row(row)
-
-        files_written += 1
+        for chunk_idx, chunk_records in splitter.split_records(records)
+    ]
+
+    n_workers = min(get_worker_count(args.ncpu), len(chunks))
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # Consume the results so writer errors are raised here
+            list(executor.map(lambda chunk: _write_chunk(*chunk), chunks))
+    else:
+        for path, chunk_records in chunks:
+            _write_chunk(path, chunk_records)
+    files_written = len(chunks)
 
     if not args.quiet:
         print(
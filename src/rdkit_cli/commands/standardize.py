@@ -1,7 +1,9 @@
 """Standardize command implementation."""
 
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from rdkit_cli.cli import RdkitHelpFormatter, add_common_io_options, add_common_processing_options
 
@@ -85,6 +87,13 @@ def register_parser(subparsers):
         action="store_true",
         help="Output Kekule SMILES (no aromaticity)",
     )
+    parser.add_argument(
+        "--canonical-form",
+        choices=["smiles", "kekule", "inchi"],
+        default="smiles",
+        help="Output form: canonical SMILES, Kekule SMILES, or SMILES regenerated "
+        "from InChI (default: smiles)",
+    )
     parser.add_argument(
         "--add-hydrogens",
         action="store_true",
@@ -130,16 +139,104 @@ def register_parser(subparsers):
         action="store_true",
         help="Remove isotope labels",
     )
+    parser.add_argument(
+        "--dedup-input",
+        action="store_true",
+        help="Skip input rows whose SMILES string exactly repeats an earlier row",
+    )
+    parser.add_argument(
+        "--dedup-output",
+        action="store_true",
+        help="Write only the first molecule for each standardized InChIKey "
+        "(implies --add-inchikey)",
+    )
+    parser.add_argument(
+        "--assume-valid",
+        action="store_true",
+        help="Skip sanitization when only canonicalizing (input must already be "
+        "valid, aromatic SMILES)",
+    )
+    parser.add_argument(
+        "--parallel-backend",
+        choices=["process", "joblib"],
+        default="process",
+        help="Parallel backend: process pool or joblib/loky (requires joblib) "
+        "(default: process)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report time spent in each standardization step",
+    )
+    parser.add_argument(
+        "--serial-threshold",
+        type=int,
+        default=500,
+        metavar="N",
+        help="Process inputs with fewer than N molecules in-process, "
+        "skipping worker pool startup (default: 500)",
+    )
 
     parser.set_defaults(func=run_standardize)
 
 
+def _validate_args(args) -> Optional[str]:
+    """
+    Check arguments before any file is opened or worker pool started.
+
+    Returns:
+        Error message, or None if arguments are valid
+    """
+    from rdkit_cli.io.formats import FileFormat, detect_format
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        return f"Input file not found: {input_path}"
+
+    try:
+        input_format = detect_format(input_path)
+        detect_format(args.output)
+    except ValueError as e:
+        return str(e)
+
+    output_dir = Path(args.output).resolve().parent
+    if not output_dir.is_dir():
+        return f"Output directory not found: {output_dir}"
+    if not os.access(output_dir, os.W_OK):
+        return f"Output directory is not writable: {output_dir}"
+
+    if args.ncpu < -1:
+        return f"Invalid --ncpu value: {args.ncpu} (use -1 for all cores, 0 for in-process)"
+    if args.serial_threshold < 0:
+        return f"Invalid --serial-threshold value: {args.serial_threshold}"
+
+    # Sniff the CSV header so a wrong --smiles-column fails before row 0
+    if input_format in (FileFormat.CSV, FileFormat.TSV) and not args.no_header:
+        import csv
+
+        delimiter = "\t" if input_format == FileFormat.TSV else ","
+        with open(input_path, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f, delimiter=delimiter), [])
+        if args.smiles_column not in header:
+            return f"SMILES column '{args.smiles_column}' not found in {input_path}"
+
+    return None
+
+
 def run_standardize(args) -> int:
     """Run the standardize command."""
     # Lazy imports
     from rdkit_cli.core.standardizer import MoleculeStandardizer
     from rdkit_cli.io import create_reader, create_writer
-    from rdkit_cli.parallel.batch import process_molecules
+    from rdkit_cli.io.readers import SMIReader, UniqueSmilesReader
+    from rdkit_cli.io.writers import TimingWriter, UniqueKeyWriter
+    from rdkit_cli.parallel.batch import process_molecules, process_molecules_sharded
+    from rdkit_cli.parallel.executor import get_worker_count
+
+    error = _validate_args(args)
+    if error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
 
     # Handle --cleanup shortcut
     normalize = args.normalize or args.cleanup
@@ -157,20 +254,26 @@ def run_standardize(args) -> int:
         fragment_parent=fragment_parent,
         tautomer_parent=args.tautomer_parent,
         include_original=args.include_original,
+        canonical_form="kekule" if args.kekule else args.canonical_form,
+        add_inchikey=args.add_inchikey or args.dedup_output,
+        profile=args.profile,
     )
 
     # Create reader
     input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {input_path}", file=sys.stderr)
-        return 1
+
+    # Canonicalization-only runs on trusted input can skip sanitization
+    canonicalize_only = not standardizer.has_transforms and standardizer.canonical_form == "smiles"
 
     reader = create_reader(
         input_path,
         smiles_column=args.smiles_column,
         name_column=args.name_column,
         has_header=not args.no_header,
+        sanitize=not (args.assume_valid and canonicalize_only),
     )
+    if args.dedup_input:
+        reader = UniqueSmilesReader(reader)
 
     # Create writer
     output_path = Path(args.output)
@@ -178,22 +281,64 @@ def run_standardize(args) -> int:
         output_path,
         columns=standardizer.get_column_names(),
     )
+    if args.dedup_output:
+        writer = deduper = UniqueKeyWriter(writer, key_column="inchikey")
+    if args.profile:
+        writer = profiler = TimingWriter(writer)
+
+    # Small inputs run in-process: pool startup costs more than it saves
+    n_workers = args.ncpu
+    if len(reader) < args.serial_threshold:
+        n_workers = 1
+
+    # SMILES files are sharded by byte range so workers parse their own input
+    sharded = (
+        isinstance(reader, SMIReader)
+        and args.parallel_backend == "process"
+        and get_worker_count(n_workers) > 1
+    )
 
     # Process
     with reader, writer:
-        result = process_molecules(
-            reader=reader,
-            writer=writer,
-            processor=standardizer.standardize,
-            n_workers=args.ncpu,
-            quiet=args.quiet,
-        )
+        if sharded:
+            result = process_molecules_sharded(
+                reader=reader,
+                writer=writer,
+                processor=standardizer.standardize,
+                n_workers=n_workers,
+                quiet=args.quiet,
+            )
+        else:
+            result = process_molecules(
+                reader=reader,
+                writer=writer,
+                processor=standardizer.standardize,
+                n_workers=n_workers,
+                quiet=args.quiet,
+                backend=args.parallel_backend,
+            )
 
     if not args.quiet:
+        skipped = ""
+        if args.dedup_input:
+            skipped += f", {reader.n_duplicates} duplicate inputs skipped"
+        if args.dedup_output:
+            skipped += f", {deduper.n_duplicates} duplicate outputs skipped"
         print(
             f"Processed {result.successful}/{result.total_processed} molecules "
-            f"({result.failed} failed) in {result.elapsed_time:.1f}s",
+            f"({result.failed} failed{skipped}) in {result.elapsed_time:.1f}s",
             file=sys.stderr,
         )
 
+    if args.profile:
+        total_ns = sum(profiler.totals.values()) or 1
+        print("Step timings:", file=sys.stderr)
+        for name, value in sorted(profiler.totals.items(), key=lambda item: -item[1]):
+            per_mol_us = value / profiler.counts[name] / 1000
+            print(
+                f"  {name:<18} {value / 1e9:8.3f}s  {100 * value / total_ns:5.1f}%  "
+                f"{per_mol_us:8.1f} us/mol",
+                file=sys.stderr,
+            )
+
     return 0 if result.failed == 0 else 1
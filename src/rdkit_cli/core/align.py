@@ -5,6 +5,20 @@ from typing import Optional
 from rdkit_cli.io.readers import MoleculeRecord
 
 
+def _embed_3d(mol):
+    """Embed a molecule in 3D with seeded ETKDGv3 and MMFF-optimize it."""
+    from rdkit import Chem
+    from rdkit.Chem import AllChem
+
+    params = AllChem.ETKDGv3()
+    params.randomSeed = 42
+
+    mol = Chem.AddHs(mol)
+    AllChem.EmbedMolecule(mol, params)
+    AllChem.MMFFOptimizeMolecule(mol)
+    return Chem.RemoveHs(mol)
+
+
 class MoleculeAligner:
     """Align molecules to a reference structure."""
 
@@ -48,7 +62,7 @@ class MoleculeAligner:
             Dictionary with aligned molecule info and RMSD
         """
         from rdkit import Chem
-        from rdkit.Chem import AllChem, rdMolAlign
+        from rdkit.Chem import rdMolAlign
 
         if record.mol is None:
             return None
@@ -58,10 +72,7 @@ class MoleculeAligner:
         # Check for 3D coordinates
         if mol.GetNumConformers() == 0:
             # Generate 3D coordinates
-            mol = Chem.AddHs(mol)
-            AllChem.EmbedMolecule(mol, randomSeed=42)
-            AllChem.MMFFOptimizeMolecule(mol)
-            mol = Chem.RemoveHs(mol)
+            mol = _embed_3d(mol)
 
         if mol.GetNumConformers() == 0:
             return None
@@ -163,14 +174,11 @@ def load_reference_molecule(path: str):
     else:
         # Try as SMILES (generate 3D)
         with open(path) as f:
-            smiles = f.read().strip().split()[0]
-        mol = Chem.MolFromSmiles(smiles)
+            # Only the first SMILES is used; stop reading at the first non-blank line
+            line = next((line for line in f if line.strip()), "")
+        mol = Chem.MolFromSmiles(line.split()[0]) if line else None
         if mol:
-            from rdkit.Chem import AllChem
-            mol = Chem.AddHs(mol)
-            AllChem.EmbedMolecule(mol, randomSeed=42)
-            AllChem.MMFFOptimizeMolecule(mol)
-            mol = Chem.RemoveHs(mol)
+            mol = _embed_3d(mol)
 
     return mol
 
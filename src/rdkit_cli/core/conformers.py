@@ -5,10 +5,12 @@ from typing import Optional, Any
 from rdkit import Chem
 from rdkit.Chem import AllChem, rdDistGeom
 
+from rdkit_cli.core.energy import build_force_field
 from rdkit_cli.io.readers import MoleculeRecord
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
 
-class ConformerGenerator:
+class ConformerGenerator(RebuildOnUnpickle):
     """Generate 3D conformers for molecules."""
 
     def __init__(
@@ -19,6 +21,8 @@ class ConformerGenerator:
         force_field: str = "mmff",
         max_iterations: int = 200,
         random_seed: int = 42,
+        prune_rms: Optional[float] = None,
+        energy_window: Optional[float] = None,
     ):
         """
         Initialize conformer generator.
@@ -30,6 +34,10 @@ class ConformerGenerator:
             force_field: Force field for optimization (mmff, uff)
             max_iterations: Maximum optimization iterations
             random_seed: Random seed for reproducibility
+            prune_rms: Heavy-atom RMSD below which embedded conformers are
+                pruned as duplicates before optimization
+            energy_window: Keep only optimized conformers within this many
+                kcal/mol of the lowest energy
         """
         self.num_conformers = num_conformers
         self.method = method.lower()
@@ -37,19 +45,33 @@ class ConformerGenerator:
         self.force_field = force_field.lower()
         self.max_iterations = max_iterations
         self.random_seed = random_seed
+        self.prune_rms = prune_rms
+        self.energy_window = energy_window
+        self.num_threads = 0  # Use all available threads
 
-        # Set up embedding parameters
+        self._init_params()
+
+    def _init_params(self):
+        """Set up embedding parameters."""
         if self.method == "etkdgv3":
-            self.params = rdDistGeom.ETKDGv3()
+            self._params = rdDistGeom.ETKDGv3()
         elif self.method == "etkdgv2":
-            self.params = rdDistGeom.ETKDGv2()
+            self._params = rdDistGeom.ETKDGv2()
         elif self.method == "etdg":
-            self.params = rdDistGeom.ETDG()
+            self._params = rdDistGeom.ETDG()
         else:
-            raise ValueError(f"Unknown method: {method}")
+            raise ValueError(f"Unknown method: {self.method}")
+
+        self._params.randomSeed = self.random_seed
+        self._params.numThreads = self.num_threads
+        if self.prune_rms is not None:
+            self._params.pruneRmsThresh = self.prune_rms
 
-        self.params.randomSeed = random_seed
-        self.params.numThreads = 0  # Use all available threads
+    def _rebuild(self):
+        # EmbedParameters cannot be pickled. Unpickled copies run inside a worker process
+        # of a pool that already uses every core, so each embeds and optimizes on a single thread
+        self.num_threads = 1
+        self._init_params()
 
     def generate(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """
@@ -72,7 +94,7 @@ class ConformerGenerator:
             conf_ids = AllChem.EmbedMultipleConfs(
                 mol,
                 numConfs=self.num_conformers,
-                params=self.params,
+                params=self._params,
             )
 
             if len(conf_ids) == 0:
@@ -85,29 +107,46 @@ class ConformerGenerator:
                     results = AllChem.MMFFOptimizeMoleculeConfs(
                         mol,
                         maxIters=self.max_iterations,
-                        numThreads=0,
+                        numThreads=self.num_threads,
                     )
                     energies = [r[1] for r in results]
                 elif self.force_field == "uff":
                     results = AllChem.UFFOptimizeMoleculeConfs(
                         mol,
                         maxIters=self.max_iterations,
-                        numThreads=0,
+                        numThreads=self.num_threads,
                     )
                     energies = [r[1] for r in results]
 
+            # Drop conformers outside the energy window so they are never written.
+            # RemoveConformer does not renumber, so track the IDs that remain.
+            conf_ids = [conf.GetId() for conf in mol.GetConformers()]
+            if energies and self.energy_window is not None:
+                min_energy = min(energies)
+                kept_ids = []
+                kept = []
+                for conf_id, energy in zip(conf_ids, energies):
+                    if energy - min_energy <= self.energy_window:
+                        kept_ids.append(conf_id)
+                        kept.append(energy)
+                    else:
+                        mol.RemoveConformer(conf_id)
+                conf_ids = kept_ids
+                energies = kept
+
             # Get lowest energy conformer
             if energies:
-                best_conf = min(range(len(energies)), key=lambda i: energies[i])
-                best_energy = energies[best_conf]
+                best_index = min(range(len(energies)), key=lambda i: energies[i])
+                best_conf = conf_ids[best_index]
+                best_energy = energies[best_index]
             else:
-                best_conf = 0
+                best_conf = conf_ids[0]
                 best_energy = None
 
             result: dict[str, Any] = {
                 "smiles": record.smiles,
                 "mol": mol,
-                "num_conformers": len(conf_ids),
+                "num_conformers": mol.GetNumConformers(),
                 "best_conformer": best_conf,
             }
 
@@ -166,19 +205,13 @@ class ConformerOptimizer:
             if mol.GetNumConformers() == 0:
                 return None
 
-            # Optimize
-            if self.force_field == "mmff":
-                result = AllChem.MMFFOptimizeMolecule(mol, maxIters=self.max_iterations)
-                props = AllChem.MMFFGetMoleculeProperties(mol)
-                if props:
-                    ff = AllChem.MMFFGetMoleculeForceField(mol, props)
-                    energy = ff.CalcEnergy() if ff else None
-                else:
-                    energy = None
-            else:
-                result = AllChem.UFFOptimizeMolecule(mol, maxIters=self.max_iterations)
-                ff = AllChem.UFFGetMoleculeForceField(mol)
-                energy = ff.CalcEnergy() if ff else None
+            # Optimize, reading the final energy from the same force field
+            ff = build_force_field(mol, self.force_field)
+            energy = None
+            if ff is not None:
+                ff.Initialize()
+                ff.Minimize(maxIts=self.max_iterations)
+                energy = ff.CalcEnergy()
 
             output: dict[str, Any] = {
                 "smiles": Chem.MolToSmiles(Chem.RemoveHs(mol)),
@@ -231,6 +264,12 @@ class TorsionScanner:
             if mol.GetNumConformers() == 0:
                 return None
 
+            # The force field only depends on topology; set it up once and
+            # evaluate it at each angle's coordinates
+            ff = build_force_field(mol, self.force_field)
+            if ff is None:
+                return None
+
             i, j, k, l = self.atom_indices
             conf = mol.GetConformer()
 
@@ -242,18 +281,7 @@ class TorsionScanner:
                     conf, i, j, k, l, angle,
                 )
                 # Compute energy at this angle
-                if self.force_field == "mmff":
-                    props = AllChem.MMFFGetMoleculeProperties(mol)
-                    if props is None:
-                        return None
-                    ff = AllChem.MMFFGetMoleculeForceField(mol, props)
-                else:
-                    ff = AllChem.UFFGetMoleculeForceField(mol)
-
-                if ff is None:
-                    return None
-
-                energy = ff.CalcEnergy()
+                energy = ff.CalcEnergy(conf.GetPositions().ravel().tolist())
                 angles.append(round(angle, 1))
                 energies.append(round(energy, 4))
                 angle += self.step
@@ -7,6 +7,7 @@ from rdkit import Chem
 from rdkit.Chem import QED, AllChem, Descriptors, rdMolDescriptors
 
 from rdkit_cli.io.readers import MoleculeRecord
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
 # Descriptor categories
 DESCRIPTOR_CATEGORIES = [
@@ -78,6 +79,8 @@ def _make_mqn_func(index: int):
     return mqn_func
 
 
+_MQN_INDEX = {name: i for i, name in enumerate(_MQN_NAMES)}
+
 for _i, _name in enumerate(_MQN_NAMES):
     DESCRIPTOR_REGISTRY[_name] = (
         _make_mqn_func(_i),
@@ -184,16 +187,22 @@ def compute_descriptor(mol: Chem.Mol, name: str) -> Optional[float]:
     func = DESCRIPTOR_REGISTRY[name][0]
 
     try:
-        value = func(mol)
-        # Handle NaN and inf
-        if value is None or (isinstance(value, float) and (value != value or abs(value) == float("inf"))):
-            return None
-        return float(value)
+        return _clean_value(func(mol))
     except Exception:
         return None
 
 
-class DescriptorCalculator:
+def _clean_value(value: Any) -> Optional[float]:
+    """Convert a raw descriptor value to float, mapping NaN and inf to None."""
+    # Handle NaN and inf
+    if value is None or (
+        isinstance(value, float) and (value != value or abs(value) == float("inf"))
+    ):
+        return None
+    return float(value)
+
+
+class DescriptorCalculator(RebuildOnUnpickle):
     """Calculator for molecular descriptors."""
 
     def __init__(
@@ -230,8 +239,23 @@ class DescriptorCalculator:
         self.precision = precision
         self.error_value = error_value
         self.generate_conformers = generate_conformers
+        self._init_funcs()
+
+    def _init_funcs(self):
+        """Resolve descriptor functions once instead of per molecule."""
+        # MQNs_ computes all 42 numbers in one call; requested MQN columns
+        # share a single evaluation per molecule instead of one call each
+        self._funcs = [
+            (name, None if name in _MQN_INDEX else DESCRIPTOR_REGISTRY[name][0])
+            for name in self.descriptors
+        ]
+        self._has_mqn = any(func is None for _, func in self._funcs)
         self._has_3d = _needs_3d(self.descriptors)
 
+    def _rebuild(self):
+        # Descriptor functions include lambdas, which cannot be pickled
+        self._init_funcs()
+
     def _format_value(self, value: Optional[float]) -> Any:
         """Format a descriptor value with precision and error handling."""
         if value is None:
@@ -267,8 +291,21 @@ class DescriptorCalculator:
         if self.include_name and record.name:
             result["name"] = record.name
 
-        for desc_name in self.descriptors:
-            value = compute_descriptor(mol, desc_name)
+        mqns = None
+        if self._has_mqn:
+            try:
+                mqns = rdMolDescriptors.MQNs_(mol)
+            except Exception:
+                pass
+
+        for desc_name, func in self._funcs:
+            try:
+                if func is None:
+                    value = None if mqns is None else float(mqns[_MQN_INDEX[desc_name]])
+                else:
+                    value = _clean_value(func(mol))
+            except Exception:
+                value = None
             result[desc_name] = self._format_value(value)
 
         return result
@@ -2,16 +2,16 @@
 
 from typing import Optional, Any
 
-from rdkit import Chem, DataStructs
+from rdkit import Chem
 from rdkit.Chem import rdMolDescriptors
-from rdkit.Chem.rdFingerprintGenerator import GetMorganGenerator
 from rdkit.SimDivFilters import rdSimDivPickers
 
-
-def get_morgan_fingerprint(mol: Chem.Mol, radius: int = 2, n_bits: int = 2048):
-    """Get Morgan fingerprint for a molecule."""
-    gen = GetMorganGenerator(radius=radius, fpSize=n_bits)
-    return gen.GetFingerprint(mol)
+from rdkit_cli.core.similarity import (
+    count_bits,
+    get_morgan_fingerprints,
+    pack_fingerprints,
+    packed_tanimoto_similarity,
+)
 
 
 class DiversityPicker:
@@ -68,7 +68,7 @@ class DiversityPicker:
             return []
 
         # Generate fingerprints
-        fps = [get_morgan_fingerprint(mol, self.radius, self.n_bits) for mol in valid_mols]
+        fps = get_morgan_fingerprints(valid_mols, self.radius, self.n_bits)
 
         # Adjust n_picks if larger than available
         n_to_pick = min(self.n_picks, len(fps))
@@ -79,14 +79,11 @@ class DiversityPicker:
         else:
             picker = rdSimDivPickers.LeaderPicker()
 
-        # Define distance function
-        def dist_func(i, j):
-            return 1 - DataStructs.TanimotoSimilarity(fps[i], fps[j])
-
         # Pick diverse molecules
         if first_picks:
             # Map first_picks to valid indices
-            mapped_first = [valid_indices.index(i) for i in first_picks if i in valid_indices]
+            position = {orig: k for k, orig in enumerate(valid_indices)}
+            mapped_first = [position[i] for i in first_picks if i in position]
             picks = list(picker.LazyBitVectorPick(fps, len(fps), n_to_pick, firstPicks=mapped_first))
         else:
             if self.seed is not None:
@@ -131,6 +128,8 @@ class DiversityAnalyzer:
         """
         import random
 
+        import numpy as np
+
         # Filter None molecules
         valid_mols = [mol for mol in mols if mol is not None]
 
@@ -142,27 +141,26 @@ class DiversityAnalyzer:
             valid_mols = random.sample(valid_mols, self.sample_size)
 
         # Generate fingerprints
-        fps = [get_morgan_fingerprint(mol, self.radius, self.n_bits) for mol in valid_mols]
+        fps = get_morgan_fingerprints(valid_mols, self.radius, self.n_bits)
 
-        # Compute pairwise similarities
-        similarities = []
+        # Compute pairwise similarities (upper triangle) from bit-packed fingerprints
+        packed = pack_fingerprints(fps)
+        counts = count_bits(packed)
         n = len(fps)
-        for i in range(n):
-            for j in range(i + 1, n):
-                sim = DataStructs.TanimotoSimilarity(fps[i], fps[j])
-                similarities.append(sim)
+        similarities = np.concatenate([
+            packed_tanimoto_similarity(packed[i], packed[i + 1:], counts[i], counts[i + 1:])
+            for i in range(n - 1)
+        ])
 
-        if not similarities:
+        if not len(similarities):
             return {"error": "Could not compute similarities"}
 
         # Calculate statistics
-        import statistics
-
-        mean_sim = statistics.mean(similarities)
-        median_sim = statistics.median(similarities)
-        min_sim = min(similarities)
-        max_sim = max(similarities)
-        stdev_sim = statistics.stdev(similarities) if len(similarities) > 1 else 0
+        mean_sim = float(similarities.mean())
+        median_sim = float(np.median(similarities))
+        min_sim = float(similarities.min())
+        max_sim = float(similarities.max())
+        stdev_sim = float(similarities.std(ddof=1)) if len(similarities) > 1 else 0
 
         return {
             "n_molecules": len(valid_mols),
@@ -16,6 +16,16 @@ def _ensure_3d(mol: Chem.Mol) -> Chem.Mol:
     return mol
 
 
+def build_force_field(mol: Chem.Mol, force_field: str = "mmff"):
+    """Set up an MMFF or UFF force field, or None if MMFF has no parameters."""
+    if force_field == "mmff":
+        props = AllChem.MMFFGetMoleculeProperties(mol)
+        if props is None:
+            return None
+        return AllChem.MMFFGetMoleculeForceField(mol, props)
+    return AllChem.UFFGetMoleculeForceField(mol)
+
+
 def compute_energy(
     mol: Chem.Mol,
     force_field: str = "mmff",
@@ -25,14 +35,7 @@ def compute_energy(
     if mol.GetNumConformers() == 0:
         return None
 
-    if force_field == "mmff":
-        props = AllChem.MMFFGetMoleculeProperties(mol)
-        if props is None:
-            return None
-        ff = AllChem.MMFFGetMoleculeForceField(mol, props)
-    else:
-        ff = AllChem.UFFGetMoleculeForceField(mol)
-
+    ff = build_force_field(mol, force_field)
     if ff is None:
         return None
     return ff.CalcEnergy()
@@ -89,20 +92,16 @@ class EnergyMinimizer:
             if mol.GetNumConformers() == 0:
                 return None
 
-            # Energy before
-            e_before = compute_energy(mol, self.force_field)
-
-            # Minimize
-            if self.force_field == "mmff":
-                converged = AllChem.MMFFOptimizeMolecule(
-                    mol, maxIters=self.max_iterations,
-                )
+            # One force field serves both energies and the minimization
+            ff = build_force_field(mol, self.force_field)
+            if ff is None:
+                e_before = e_after = None
+                converged = -1
             else:
-                converged = AllChem.UFFOptimizeMolecule(
-                    mol, maxIters=self.max_iterations,
-                )
-
-            e_after = compute_energy(mol, self.force_field)
+                e_before = ff.CalcEnergy()
+                ff.Initialize()
+                converged = ff.Minimize(maxIts=self.max_iterations)
+                e_after = ff.CalcEnergy()
 
             result = {
                 "smiles": record.smiles,
@@ -1,12 +1,14 @@
 """Molecular filtering engine."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Any, Callable
 
 from rdkit import Chem
 from rdkit.Chem import Descriptors, FilterCatalog, rdfiltercatalog
 
 from rdkit_cli.io.readers import MoleculeRecord
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
 
 @dataclass
@@ -51,6 +53,57 @@ DRUGLIKE_RULES = {
 }
 
 
+def _property_getter(property_name: str) -> Optional[Callable[[Chem.Mol], float]]:
+    """Resolve a property name to the function computing it, or None if unknown."""
+    if property_name == "NumAtoms":
+        return Chem.Mol.GetNumAtoms
+    return getattr(Descriptors, property_name, None)
+
+
+# Relative cost tiers of common descriptors, so filters can reject on cheap ones first
+_PROPERTY_COST = {
+    "NumAtoms": 0,
+    "MolWt": 0,
+    "RingCount": 0,
+    "HeavyAtomCount": 1,
+    "NumHDonors": 1,
+    "TPSA": 1,
+    "NumAromaticRings": 1,
+    "FractionCSP3": 1,
+    "NumHAcceptors": 2,
+    "NumRotatableBonds": 3,
+    "MolLogP": 4,
+    "MolMR": 4,
+}
+_DEFAULT_PROPERTY_COST = 2
+
+
+def _compile_rules(
+    rules: dict[str, tuple[Optional[float], Optional[float]]],
+) -> list[tuple[Callable[[Chem.Mol], float], Optional[float], Optional[float]]]:
+    """
+    Resolve rule property names once, cheapest descriptor first.
+
+    Unknown properties always pass and are dropped.
+    """
+    compiled = []
+    for prop in sorted(rules, key=lambda p: _PROPERTY_COST.get(p, _DEFAULT_PROPERTY_COST)):
+        getter = _property_getter(prop)
+        if getter is not None:
+            min_val, max_val = rules[prop]
+            compiled.append((getter, min_val, max_val))
+    return compiled
+
+
+def _in_range(value: float, min_val: Optional[float], max_val: Optional[float]) -> bool:
+    """Check a value against optional bounds."""
+    if min_val is not None and value < min_val:
+        return False
+    if max_val is not None and value > max_val:
+        return False
+    return True
+
+
 def check_property_range(
     mol: Chem.Mol,
     property_name: str,
@@ -58,21 +111,11 @@ def check_property_range(
     max_val: Optional[float],
 ) -> bool:
     """Check if a property is within range."""
-    # Get property function
-    if property_name == "NumAtoms":
-        value = mol.GetNumAtoms()
-    elif hasattr(Descriptors, property_name):
-        func = getattr(Descriptors, property_name)
-        value = func(mol)
-    else:
+    getter = _property_getter(property_name)
+    if getter is None:
         return True  # Unknown property, pass
 
-    if min_val is not None and value < min_val:
-        return False
-    if max_val is not None and value > max_val:
-        return False
-
-    return True
+    return _in_range(getter(mol), min_val, max_val)
 
 
 def check_druglike_rules(mol: Chem.Mol, rule_name: str) -> FilterResult:
@@ -165,7 +208,7 @@ class SubstructureFilter:
         return result
 
 
-class PropertyFilter:
+class PropertyFilter(RebuildOnUnpickle):
     """Filter molecules by property values."""
 
     def __init__(
@@ -185,14 +228,19 @@ class PropertyFilter:
         self.rules = rules
         self.include_smiles = include_smiles
         self.include_name = include_name
+        self._checks = _compile_rules(rules)
+
+    def _rebuild(self):
+        # Descriptor functions include lambdas, which cannot be pickled
+        self._checks = _compile_rules(self.rules)
 
     def filter(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """Filter a molecule record."""
         if record.mol is None:
             return None
 
-        for prop, (min_val, max_val) in self.rules.items():
-            if not check_property_range(record.mol, prop, min_val, max_val):
+        for getter, min_val, max_val in self._checks:
+            if not _in_range(getter(record.mol), min_val, max_val):
                 return None
 
         result: dict[str, Any] = {}
@@ -208,7 +256,7 @@ class PropertyFilter:
         return result
 
 
-class DruglikeFilter:
+class DruglikeFilter(RebuildOnUnpickle):
     """Filter molecules by drug-likeness rules."""
 
     def __init__(
@@ -234,21 +282,24 @@ class DruglikeFilter:
         self.max_violations = max_violations
         self.include_smiles = include_smiles
         self.include_name = include_name
+        self._checks = _compile_rules(DRUGLIKE_RULES[rule_name])
+
+    def _rebuild(self):
+        # Descriptor functions include lambdas, which cannot be pickled
+        self._checks = _compile_rules(DRUGLIKE_RULES[self.rule_name])
 
     def filter(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """Filter a molecule record."""
         if record.mol is None:
             return None
 
-        rules = DRUGLIKE_RULES[self.rule_name]
+        # Each property is computed once; stop as soon as the molecule is rejected
         violations = 0
-
-        for prop, (min_val, max_val) in rules.items():
-            if not check_property_range(record.mol, prop, min_val, max_val):
+        for getter, min_val, max_val in self._checks:
+            if not _in_range(getter(record.mol), min_val, max_val):
                 violations += 1
-
-        if violations > self.max_violations:
-            return None
+                if violations > self.max_violations:
+                    return None
 
         result: dict[str, Any] = {}
         if self.include_smiles:
@@ -274,7 +325,19 @@ ALERT_CATALOGS = {
 }
 
 
-class PAINSFilter:
+@lru_cache(maxsize=None)
+def _alert_catalog(catalog_name: str) -> FilterCatalog.FilterCatalog:
+    """Alert catalog shared by every filter using it; matching does not modify it."""
+    params = FilterCatalog.FilterCatalogParams()
+    if catalog_name == "all":
+        for cat in ALERT_CATALOGS.values():
+            params.AddCatalog(cat)
+    else:
+        params.AddCatalog(ALERT_CATALOGS[catalog_name])
+    return FilterCatalog.FilterCatalog(params)
+
+
+class PAINSFilter(RebuildOnUnpickle):
     """Filter molecules using structural alert catalogs (PAINS, Brenk, NIH, ZINC)."""
 
     def __init__(
@@ -293,23 +356,26 @@ class PAINSFilter:
             include_name: Include molecule name in output
             catalog_name: Alert catalog to use (pains, brenk, nih, zinc, all)
         """
-        self.exclude = exclude
-        self.include_smiles = include_smiles
-        self.include_name = include_name
-
-        # Initialize filter catalog
-        params = FilterCatalog.FilterCatalogParams()
-        if catalog_name == "all":
-            for cat in ALERT_CATALOGS.values():
-                params.AddCatalog(cat)
-        elif catalog_name in ALERT_CATALOGS:
-            params.AddCatalog(ALERT_CATALOGS[catalog_name])
-        else:
+        if catalog_name != "all" and catalog_name not in ALERT_CATALOGS:
             raise ValueError(
                 f"Unknown catalog: {catalog_name}. "
                 f"Available: {', '.join(list(ALERT_CATALOGS.keys()) + ['all'])}"
             )
-        self.catalog = FilterCatalog.FilterCatalog(params)
+
+        self.exclude = exclude
+        self.include_smiles = include_smiles
+        self.include_name = include_name
+        self.catalog_name = catalog_name
+        self._rebuild()
+
+    def _rebuild(self):
+        # Fetching the cached catalog in a worker is cheaper than pickling its patterns
+        self._catalog = _alert_catalog(self.catalog_name)
+
+    @property
+    def catalog(self) -> FilterCatalog.FilterCatalog:
+        """Alert catalog molecules are matched against."""
+        return self._catalog
 
     def filter(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """Filter a molecule record (returns None if PAINS hit and exclude=True)."""
@@ -317,7 +383,7 @@ class PAINSFilter:
             return None
 
         # Check for PAINS
-        entry = self.catalog.GetFirstMatch(record.mol)
+        entry = self._catalog.GetFirstMatch(record.mol)
         is_pains = entry is not None
 
         # If exclude=True (default), filter out PAINS hits
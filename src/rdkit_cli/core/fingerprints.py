@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Any
+from functools import lru_cache, partial
+from typing import Callable, Optional, Any
 
 from rdkit import Chem, DataStructs
 from rdkit.Chem import AllChem, MACCSkeys, rdMolDescriptors
@@ -16,6 +17,7 @@ from rdkit.Chem import rdMHFPFingerprint
 from rdkit.Chem.Pharm2D import Gobbi_Pharm2D, Generate
 
 from rdkit_cli.io.readers import MoleculeRecord
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
 
 class FingerprintType(Enum):
@@ -105,6 +107,71 @@ def list_fingerprints() -> list[FingerprintInfo]:
     return list(FINGERPRINT_INFO.values())
 
 
+def create_generator(fp_type: FingerprintType, n_bits: int = 2048, radius: int = 2) -> Any:
+    """
+    Create a reusable fingerprint generator.
+
+    Args:
+        fp_type: Type of fingerprint
+        n_bits: Number of bits
+        radius: Radius for Morgan/MHFP fingerprints
+
+    Returns:
+        Generator object, or None for types computed by a plain function
+    """
+    if fp_type == FingerprintType.MORGAN:
+        return GetMorganGenerator(radius=radius, fpSize=n_bits)
+    elif fp_type == FingerprintType.ATOMPAIR:
+        return GetAtomPairGenerator(fpSize=n_bits)
+    elif fp_type == FingerprintType.TORSION:
+        return GetTopologicalTorsionGenerator(fpSize=n_bits)
+    elif fp_type == FingerprintType.MHFP:
+        return rdMHFPFingerprint.MHFPEncoder(n_bits)
+    return None
+
+
+def create_fingerprint_function(
+    fp_type: FingerprintType,
+    n_bits: int = 2048,
+    radius: int = 2,
+    use_counts: bool = False,
+) -> Callable[[Chem.Mol], Any]:
+    """
+    Bind fingerprint parameters once and return a per-molecule function.
+
+    Resolving the type dispatch and generator up front keeps the per-molecule
+    call free of branching when the same fingerprint is computed many times.
+
+    Args:
+        fp_type: Type of fingerprint
+        n_bits: Number of bits
+        radius: Radius for Morgan/MHFP fingerprints
+        use_counts: Use count fingerprints (Morgan only)
+
+    Returns:
+        Function taking a molecule and returning its fingerprint
+    """
+    generator = create_generator(fp_type, n_bits=n_bits, radius=radius)
+
+    if fp_type == FingerprintType.MORGAN:
+        return generator.GetCountFingerprint if use_counts else generator.GetFingerprint
+    elif fp_type == FingerprintType.MACCS:
+        return MACCSkeys.GenMACCSKeys
+    elif fp_type == FingerprintType.RDKIT:
+        return partial(Chem.RDKFingerprint, fpSize=n_bits)
+    elif fp_type in (FingerprintType.ATOMPAIR, FingerprintType.TORSION):
+        return generator.GetFingerprint
+    elif fp_type == FingerprintType.PATTERN:
+        return partial(Chem.PatternFingerprint, fpSize=n_bits)
+    elif fp_type == FingerprintType.AVALON:
+        return partial(pyAvalonTools.GetAvalonFP, nBits=n_bits)
+    elif fp_type == FingerprintType.MHFP:
+        return partial(generator.EncodeSECFPMol, radius=radius, length=n_bits)
+    elif fp_type == FingerprintType.PHARMACOPHORE:
+        return partial(Generate.Gen2DFingerprint, sigFactory=Gobbi_Pharm2D.factory)
+    raise ValueError(f"Unknown fingerprint type: {fp_type}")
+
+
 def compute_fingerprint(
     mol: Chem.Mol,
     fp_type: FingerprintType,
@@ -115,6 +182,8 @@ def compute_fingerprint(
     """
     Compute fingerprint for a molecule.
 
+    For many molecules, build the function once with create_fingerprint_function().
+
     Args:
         mol: RDKit molecule
         fp_type: Type of fingerprint
@@ -126,43 +195,7 @@ def compute_fingerprint(
         Fingerprint bit vector or None on failure
     """
     try:
-        if fp_type == FingerprintType.MORGAN:
-            gen = GetMorganGenerator(radius=radius, fpSize=n_bits)
-            if use_counts:
-                return gen.GetCountFingerprint(mol)
-            else:
-                return gen.GetFingerprint(mol)
-
-        elif fp_type == FingerprintType.MACCS:
-            return MACCSkeys.GenMACCSKeys(mol)
-
-        elif fp_type == FingerprintType.RDKIT:
-            return Chem.RDKFingerprint(mol, fpSize=n_bits)
-
-        elif fp_type == FingerprintType.ATOMPAIR:
-            gen = GetAtomPairGenerator(fpSize=n_bits)
-            return gen.GetFingerprint(mol)
-
-        elif fp_type == FingerprintType.TORSION:
-            gen = GetTopologicalTorsionGenerator(fpSize=n_bits)
-            return gen.GetFingerprint(mol)
-
-        elif fp_type == FingerprintType.PATTERN:
-            return Chem.PatternFingerprint(mol, fpSize=n_bits)
-
-        elif fp_type == FingerprintType.AVALON:
-            return pyAvalonTools.GetAvalonFP(mol, nBits=n_bits)
-
-        elif fp_type == FingerprintType.MHFP:
-            encoder = rdMHFPFingerprint.MHFPEncoder(n_bits)
-            return encoder.EncodeSECFPMol(mol, radius=radius, length=n_bits)
-
-        elif fp_type == FingerprintType.PHARMACOPHORE:
-            return Generate.Gen2DFingerprint(mol, Gobbi_Pharm2D.factory)
-
-        else:
-            raise ValueError(f"Unknown fingerprint type: {fp_type}")
-
+        return create_fingerprint_function(fp_type, n_bits, radius, use_counts)(mol)
     except Exception:
         return None
 
@@ -188,6 +221,35 @@ def fingerprint_to_bitstring(fp) -> str:
     return fp.ToBitString()
 
 
+def fingerprint_to_bits(fp) -> list[int]:
+    """Convert fingerprint to a list of 0/1 ints, one per bit."""
+    import numpy as np
+
+    if fp is None:
+        return []
+
+    # Decode the bit string as bytes in one vectorized step
+    bits = np.frombuffer(fp.ToBitString().encode("ascii"), dtype=np.uint8) - ord("0")
+    return bits.tolist()
+
+
+def fingerprint_to_packed(fp):
+    """Convert fingerprint to a packed uint8 array, eight bits per byte."""
+    import numpy as np
+
+    if fp is None:
+        return None
+
+    bits = np.frombuffer(fp.ToBitString().encode("ascii"), dtype=np.uint8) - ord("0")
+    return np.packbits(bits)
+
+
+@lru_cache(maxsize=8)
+def _bit_column_names(n_bits: int) -> tuple[str, ...]:
+    """Column names for per-bit output, shared by every row of a run."""
+    return tuple(f"bit_{i}" for i in range(n_bits))
+
+
 def fingerprint_to_numpy(fp):
     """Convert fingerprint to numpy array."""
     import numpy as np
@@ -200,7 +262,7 @@ def fingerprint_to_numpy(fp):
     return arr
 
 
-class FingerprintCalculator:
+class FingerprintCalculator(RebuildOnUnpickle):
     """Calculator for molecular fingerprints."""
 
     def __init__(
@@ -221,7 +283,7 @@ class FingerprintCalculator:
             n_bits: Number of bits
             radius: Radius for Morgan fingerprints
             use_counts: Use count fingerprints
-            output_format: Output format (hex, bitstring, bits)
+            output_format: Output format (hex, bitstring, bits, numpy)
             include_smiles: Include SMILES in output
             include_name: Include molecule name in output
         """
@@ -239,6 +301,18 @@ class FingerprintCalculator:
         elif fp_type == FingerprintType.PHARMACOPHORE:
             self.n_bits = 39972
 
+        self._init_fp_func()
+
+    def _init_fp_func(self):
+        """Build the specialized per-molecule fingerprint function."""
+        self._fp_func = create_fingerprint_function(
+            self.fp_type, n_bits=self.n_bits, radius=self.radius, use_counts=self.use_counts
+        )
+
+    def _rebuild(self):
+        # RDKit generators cannot be pickled
+        self._init_fp_func()
+
     def compute(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """
         Compute fingerprint for a molecule record.
@@ -252,13 +326,10 @@ class FingerprintCalculator:
         if record.mol is None:
             return None
 
-        fp = compute_fingerprint(
-            record.mol,
-            self.fp_type,
-            n_bits=self.n_bits,
-            radius=self.radius,
-            use_counts=self.use_counts,
-        )
+        try:
+            fp = self._fp_func(record.mol)
+        except Exception:
+            fp = None
 
         if fp is None:
             return None
@@ -277,9 +348,10 @@ class FingerprintCalculator:
             result["fingerprint"] = fingerprint_to_bitstring(fp)
         elif self.output_format == "bits":
             # Individual bit columns
-            bits = fingerprint_to_bitstring(fp)
-            for i, bit in enumerate(bits):
-                result[f"bit_{i}"] = int(bit)
+            bits = fingerprint_to_bits(fp)
+            result.update(zip(_bit_column_names(len(bits)), bits))
+        elif self.output_format == "numpy":
+            result["fingerprint"] = fingerprint_to_packed(fp)
         else:
             result["fingerprint"] = fingerprint_to_hex(fp)
 
@@ -294,7 +366,7 @@ class FingerprintCalculator:
             cols.append("name")
 
         if self.output_format == "bits":
-            cols.extend([f"bit_{i}" for i in range(self.n_bits)])
+            cols.extend(_bit_column_names(self.n_bits))
         else:
             cols.append("fingerprint")
 
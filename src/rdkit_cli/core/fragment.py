@@ -142,6 +142,27 @@ class RECAPFragmenter:
             return []
 
 
+# Functional group SMARTS patterns counted by FunctionalGroupExtractor
+FUNCTIONAL_GROUP_SMARTS = {
+    "alcohol": "[OX2H]",
+    "aldehyde": "[CX3H1](=O)[#6]",
+    "ketone": "[#6][CX3](=O)[#6]",
+    "carboxylic_acid": "[CX3](=O)[OX2H1]",
+    "ester": "[#6][CX3](=O)[OX2][#6]",
+    "ether": "[OD2]([#6])[#6]",
+    "amine_primary": "[NX3H2][#6]",
+    "amine_secondary": "[NX3H1]([#6])[#6]",
+    "amine_tertiary": "[NX3]([#6])([#6])[#6]",
+    "amide": "[NX3][CX3](=[OX1])[#6]",
+    "nitro": "[$([NX3](=O)=O),$([NX3+](=O)[O-])]",
+    "nitrile": "[NX1]#[CX2]",
+    "halogen": "[F,Cl,Br,I]",
+    "thiol": "[SX2H]",
+    "sulfide": "[#16X2]([#6])[#6]",
+    "aromatic_ring": "a1aaaaa1",
+}
+
+
 class FunctionalGroupExtractor:
     """Extract functional groups from molecules."""
 
@@ -159,7 +180,12 @@ class FunctionalGroupExtractor:
         """
         self.include_smiles = include_smiles
         self.include_name = include_name
-        # Functional group extraction via SMARTS patterns below
+        # Patterns are parsed once here rather than for every molecule
+        self.patterns = [
+            (name, pattern)
+            for name, smarts in FUNCTIONAL_GROUP_SMARTS.items()
+            if (pattern := Chem.MolFromSmarts(smarts)) is not None
+        ]
 
     def extract(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """
@@ -175,26 +201,6 @@ class FunctionalGroupExtractor:
             return None
 
         try:
-            # Get functional groups using SMARTS patterns
-            fg_patterns = {
-                "alcohol": "[OX2H]",
-                "aldehyde": "[CX3H1](=O)[#6]",
-                "ketone": "[#6][CX3](=O)[#6]",
-                "carboxylic_acid": "[CX3](=O)[OX2H1]",
-                "ester": "[#6][CX3](=O)[OX2][#6]",
-                "ether": "[OD2]([#6])[#6]",
-                "amine_primary": "[NX3H2][#6]",
-                "amine_secondary": "[NX3H1]([#6])[#6]",
-                "amine_tertiary": "[NX3]([#6])([#6])[#6]",
-                "amide": "[NX3][CX3](=[OX1])[#6]",
-                "nitro": "[$([NX3](=O)=O),$([NX3+](=O)[O-])]",
-                "nitrile": "[NX1]#[CX2]",
-                "halogen": "[F,Cl,Br,I]",
-                "thiol": "[SX2H]",
-                "sulfide": "[#16X2]([#6])[#6]",
-                "aromatic_ring": "a1aaaaa1",
-            }
-
             result: dict[str, Any] = {}
 
             if self.include_smiles:
@@ -202,11 +208,9 @@ class FunctionalGroupExtractor:
             if self.include_name and record.name:
                 result["name"] = record.name
 
-            for name, smarts in fg_patterns.items():
-                pattern = Chem.MolFromSmarts(smarts)
-                if pattern:
-                    matches = record.mol.GetSubstructMatches(pattern)
-                    result[f"n_{name}"] = len(matches)
+            for name, pattern in self.patterns:
+                matches = record.mol.GetSubstructMatches(pattern)
+                result[f"n_{name}"] = len(matches)
 
             return result
 
@@ -4,6 +4,7 @@ Note: This is a simplified implementation. For more accurate pH-dependent
 protonation, consider using Dimorphite-DL or similar specialized tools.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -31,6 +32,14 @@ PKA_RULES = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _compile_smarts(smarts: str):
+    """Parse a SMARTS pattern once per process; None if invalid."""
+    from rdkit import Chem
+
+    return Chem.MolFromSmarts(smarts)
+
+
 def get_protonation_sites(mol) -> list[dict]:
     """
     Identify potential protonation/deprotonation sites in a molecule.
@@ -41,15 +50,13 @@ def get_protonation_sites(mol) -> list[dict]:
     Returns:
         List of dictionaries with site information
     """
-    from rdkit import Chem
-
     if mol is None:
         return []
 
     sites = []
 
     for smarts, pka, prot_smarts, deprot_smarts in PKA_RULES:
-        pattern = Chem.MolFromSmarts(smarts)
+        pattern = _compile_smarts(smarts)
         if pattern is None:
             continue
 
@@ -255,7 +262,7 @@ def neutralize_mol(mol):
     mol = Chem.RWMol(mol)
 
     for reactant, product in patts:
-        patt = Chem.MolFromSmarts(reactant)
+        patt = _compile_smarts(reactant)
         if patt is None:
             continue
 
@@ -54,6 +54,29 @@ def calculate_rmsd(
         return None
 
 
+def _kabsch_rmsd(ref, probes):
+    """
+    Optimal-superposition RMSD of each probe onto a reference (Kabsch).
+
+    Args:
+        ref: Centered reference coordinates, shape (n_atoms, 3)
+        probes: Centered probe coordinates, shape (n_probes, n_atoms, 3)
+
+    Returns:
+        Array of RMSD values, one per probe
+    """
+    import numpy as np
+
+    # The optimal rotation's residual follows from the singular values of
+    # each 3x3 covariance matrix; the sign flip excludes reflections
+    cov = np.einsum("ak,pal->pkl", ref, probes)
+    u, sv, vt = np.linalg.svd(cov)
+    sv[:, 2] *= np.sign(np.linalg.det(u) * np.linalg.det(vt))
+
+    sq = (ref**2).sum() + (probes**2).sum(axis=(1, 2)) - 2.0 * sv.sum(axis=1)
+    return np.sqrt(np.maximum(sq, 0.0) / ref.shape[0])
+
+
 def calculate_conformer_rmsd_matrix(mol, symmetry: bool = True) -> list[list[float]]:
     """
     Calculate pairwise RMSD matrix between all conformers of a molecule.
@@ -65,24 +88,29 @@ def calculate_conformer_rmsd_matrix(mol, symmetry: bool = True) -> list[list[flo
     Returns:
         2D list with RMSD values
     """
-    from rdkit.Chem import AllChem
+    import numpy as np
 
     n_conf = mol.GetNumConformers()
     if n_conf == 0:
         return []
 
-    matrix = [[0.0] * n_conf for _ in range(n_conf)]
+    coords = np.array([conf.GetPositions() for conf in mol.GetConformers()])
+    matrix = np.zeros((n_conf, n_conf))
 
-    for i in range(n_conf):
-        for j in range(i + 1, n_conf):
-            if symmetry:
-                rmsd = AllChem.GetConformerRMS(mol, i, j, prealigned=False)
-            else:
-                rmsd = AllChem.GetConformerRMS(mol, i, j, prealigned=True)
-            matrix[i][j] = rmsd
-            matrix[j][i] = rmsd
+    if symmetry:
+        # Each pair is superimposed before comparison, as GetConformerRMS
+        # does, but all pairs for a row are solved in one batch
+        coords = coords - coords.mean(axis=1, keepdims=True)
+
+    for i in range(n_conf - 1):
+        if symmetry:
+            row = _kabsch_rmsd(coords[i], coords[i + 1:])
+        else:
+            row = np.sqrt(((coords[i + 1:] - coords[i]) ** 2).sum(axis=(1, 2)) / coords.shape[1])
+        matrix[i, i + 1:] = row
+        matrix[i + 1:, i] = row
 
-    return matrix
+    return matrix.tolist()
 
 
 def cluster_conformers_by_rmsd(
@@ -18,6 +18,9 @@ from rdkit_cli.io.readers import MoleculeRecord
 # Cache for fragment scores (loaded lazily)
 _fscores: Optional[dict] = None
 
+# Morgan generator for fragment counts (created lazily)
+_morgan_gen = None
+
 
 def _load_fragment_scores() -> dict:
     """Load fragment contribution scores from RDKit Contrib."""
@@ -40,6 +43,15 @@ def _load_fragment_scores() -> dict:
     return _fscores
 
 
+def _get_morgan_generator():
+    """Get the shared radius-2 Morgan generator used for fragment counts."""
+    global _morgan_gen
+    if _morgan_gen is None:
+        from rdkit.Chem.rdFingerprintGenerator import GetMorganGenerator
+        _morgan_gen = GetMorganGenerator(radius=2)
+    return _morgan_gen
+
+
 def _generate_default_scores() -> dict:
     """Generate default fragment scores (simplified version)."""
     # This is a simplified fallback - the full implementation requires
@@ -70,9 +82,7 @@ def calculate_sa_score(mol) -> Optional[float]:
         fscores = _load_fragment_scores()
 
         # Calculate Morgan fingerprint fragments
-        from rdkit.Chem.rdFingerprintGenerator import GetMorganGenerator
-        gen = GetMorganGenerator(radius=2)
-        fp = gen.GetSparseCountFingerprint(mol)
+        fp = _get_morgan_generator().GetSparseCountFingerprint(mol)
         fps = fp.GetNonzeroElements()
 
         # Fragment score
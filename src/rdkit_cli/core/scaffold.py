@@ -130,11 +130,17 @@ class ScaffoldDecomposer:
         if record.mol is None:
             return None
 
-        scaffold = get_murcko_scaffold(record.mol)
-        if scaffold is None:
+        # Derive both scaffolds from one Murcko core rather than extracting it twice
+        try:
+            core = MurckoScaffold.GetScaffoldForMol(record.mol)
+            scaffold = Chem.MolToSmiles(core)
+        except Exception:
             return None
 
-        generic_scaffold = get_murcko_scaffold(record.mol, generic=True)
+        try:
+            generic_scaffold = Chem.MolToSmiles(MurckoScaffold.MakeScaffoldGeneric(core))
+        except Exception:
+            generic_scaffold = None
 
         result: dict[str, Any] = {}
 
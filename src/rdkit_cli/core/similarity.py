@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Any
 
 from rdkit import Chem, DataStructs
@@ -30,10 +31,52 @@ class SimilarityMetric(Enum):
     TVERSKY = "tversky"
 
 
+# Metric dispatch tables; Tversky takes extra parameters and is handled apart
+_METRIC_FUNCS = {
+    SimilarityMetric.TANIMOTO: DataStructs.TanimotoSimilarity,
+    SimilarityMetric.DICE: DataStructs.DiceSimilarity,
+    SimilarityMetric.COSINE: DataStructs.CosineSimilarity,
+    SimilarityMetric.SOKAL: DataStructs.SokalSimilarity,
+    SimilarityMetric.RUSSEL: DataStructs.RusselSimilarity,
+    SimilarityMetric.ALLBIT: DataStructs.AllBitSimilarity,
+    SimilarityMetric.ASYMMETRIC: DataStructs.AsymmetricSimilarity,
+    SimilarityMetric.BRAUNBLANQUET: DataStructs.BraunBlanquetSimilarity,
+    SimilarityMetric.KULCZYNSKI: DataStructs.KulczynskiSimilarity,
+    SimilarityMetric.MCCONNAUGHEY: DataStructs.McConnaugheySimilarity,
+    SimilarityMetric.ONBIT: DataStructs.OnBitSimilarity,
+    SimilarityMetric.ROGOTGOLDBERG: DataStructs.RogotGoldbergSimilarity,
+}
+
+_BULK_METRIC_FUNCS = {
+    SimilarityMetric.TANIMOTO: DataStructs.BulkTanimotoSimilarity,
+    SimilarityMetric.DICE: DataStructs.BulkDiceSimilarity,
+    SimilarityMetric.COSINE: DataStructs.BulkCosineSimilarity,
+    SimilarityMetric.SOKAL: DataStructs.BulkSokalSimilarity,
+    SimilarityMetric.RUSSEL: DataStructs.BulkRusselSimilarity,
+    SimilarityMetric.ALLBIT: DataStructs.BulkAllBitSimilarity,
+    SimilarityMetric.ASYMMETRIC: DataStructs.BulkAsymmetricSimilarity,
+    SimilarityMetric.BRAUNBLANQUET: DataStructs.BulkBraunBlanquetSimilarity,
+    SimilarityMetric.KULCZYNSKI: DataStructs.BulkKulczynskiSimilarity,
+    SimilarityMetric.MCCONNAUGHEY: DataStructs.BulkMcConnaugheySimilarity,
+    SimilarityMetric.ONBIT: DataStructs.BulkOnBitSimilarity,
+    SimilarityMetric.ROGOTGOLDBERG: DataStructs.BulkRogotGoldbergSimilarity,
+}
+
+
+@lru_cache(maxsize=None)
+def _morgan_generator(radius: int, n_bits: int):
+    """Morgan generator shared by every call with the same settings."""
+    return GetMorganGenerator(radius=radius, fpSize=n_bits)
+
+
 def get_morgan_fingerprint(mol: Chem.Mol, radius: int = 2, n_bits: int = 2048):
     """Get Morgan fingerprint for a molecule."""
-    gen = GetMorganGenerator(radius=radius, fpSize=n_bits)
-    return gen.GetFingerprint(mol)
+    return _morgan_generator(radius, n_bits).GetFingerprint(mol)
+
+
+def get_morgan_fingerprints(mols: list[Chem.Mol], radius: int = 2, n_bits: int = 2048) -> list:
+    """Get Morgan fingerprints for many molecules in one RDKit call."""
+    return list(_morgan_generator(radius, n_bits).GetFingerprints(mols, numThreads=0))
 
 
 def compute_similarity(
@@ -56,25 +99,10 @@ def compute_similarity(
     Returns:
         Similarity score (0-1)
     """
-    metric_funcs = {
-        SimilarityMetric.TANIMOTO: DataStructs.TanimotoSimilarity,
-        SimilarityMetric.DICE: DataStructs.DiceSimilarity,
-        SimilarityMetric.COSINE: DataStructs.CosineSimilarity,
-        SimilarityMetric.SOKAL: DataStructs.SokalSimilarity,
-        SimilarityMetric.RUSSEL: DataStructs.RusselSimilarity,
-        SimilarityMetric.ALLBIT: DataStructs.AllBitSimilarity,
-        SimilarityMetric.ASYMMETRIC: DataStructs.AsymmetricSimilarity,
-        SimilarityMetric.BRAUNBLANQUET: DataStructs.BraunBlanquetSimilarity,
-        SimilarityMetric.KULCZYNSKI: DataStructs.KulczynskiSimilarity,
-        SimilarityMetric.MCCONNAUGHEY: DataStructs.McConnaugheySimilarity,
-        SimilarityMetric.ONBIT: DataStructs.OnBitSimilarity,
-        SimilarityMetric.ROGOTGOLDBERG: DataStructs.RogotGoldbergSimilarity,
-    }
-
     if metric == SimilarityMetric.TVERSKY:
         return DataStructs.TverskySimilarity(fp1, fp2, tversky_alpha, tversky_beta)
 
-    func = metric_funcs.get(metric)
+    func = _METRIC_FUNCS.get(metric)
     if func is None:
         raise ValueError(f"Unknown metric: {metric}")
     return func(fp1, fp2)
@@ -85,6 +113,85 @@ def bulk_tanimoto_similarity(query_fp, fps: list) -> list[float]:
     return list(DataStructs.BulkTanimotoSimilarity(query_fp, fps))
 
 
+def bulk_similarity(
+    query_fp,
+    fps: list,
+    metric: SimilarityMetric = SimilarityMetric.TANIMOTO,
+    tversky_alpha: float = 0.5,
+    tversky_beta: float = 0.5,
+) -> list[float]:
+    """
+    Compute similarity of a query against multiple fingerprints in one call.
+
+    Args:
+        query_fp: Query fingerprint
+        fps: Fingerprints to compare against
+        metric: Similarity metric to use
+        tversky_alpha: Alpha parameter for Tversky index
+        tversky_beta: Beta parameter for Tversky index
+
+    Returns:
+        Similarity scores, one per fingerprint in fps
+    """
+    if metric == SimilarityMetric.TVERSKY:
+        return list(DataStructs.BulkTverskySimilarity(query_fp, fps, tversky_alpha, tversky_beta))
+
+    func = _BULK_METRIC_FUNCS.get(metric)
+    if func is None:
+        raise ValueError(f"Unknown metric: {metric}")
+    return list(func(query_fp, fps))
+
+
+def pack_fingerprints(fps: list):
+    """
+    Pack bit vector fingerprints into rows of 64-bit words.
+
+    Args:
+        fps: Bit vector fingerprints of equal length
+
+    Returns:
+        uint64 array of shape (len(fps), ceil(n_bits / 64))
+    """
+    import numpy as np
+
+    n_bits = fps[0].GetNumBits() if fps else 0
+    bits = np.zeros((len(fps), -(-n_bits // 64) * 64), dtype=np.uint8)
+    if fps:
+        text = "".join(fp.ToBitString() for fp in fps).encode("ascii")
+        bits[:, :n_bits] = np.frombuffer(text, dtype=np.uint8).reshape(len(fps), n_bits) - ord("0")
+    return np.packbits(bits, axis=1).view(np.uint64)
+
+
+def count_bits(packed):
+    """Count set bits in each row of packed fingerprints."""
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(packed).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(packed.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def packed_tanimoto_similarity(query, packed, query_count: int, counts):
+    """
+    Compute Tanimoto similarity of a packed query against packed fingerprints.
+
+    Args:
+        query: Packed query fingerprint (one row of pack_fingerprints)
+        packed: Packed fingerprints to compare against
+        query_count: Number of bits set in the query
+        counts: Number of bits set in each row of packed
+
+    Returns:
+        Array of similarity scores, equal to RDKit's BulkTanimotoSimilarity
+    """
+    import numpy as np
+
+    common = count_bits(packed & query)
+    union = counts + query_count - common
+    # Like RDKit, two empty fingerprints have similarity 0
+    return np.divide(common, union, out=np.zeros(len(common)), where=union > 0)
+
+
 class SimilaritySearcher:
     """Search for similar molecules."""
 
@@ -180,25 +287,33 @@ def compute_similarity_matrix(
     Returns:
         Symmetric similarity matrix
     """
+    import numpy as np
+
     # Generate fingerprints
-    fps = [get_morgan_fingerprint(mol, radius, n_bits) for mol in mols if mol is not None]
+    fps = get_morgan_fingerprints([mol for mol in mols if mol is not None], radius, n_bits)
     n = len(fps)
 
-    # Compute pairwise similarities
-    matrix = [[0.0] * n for _ in range(n)]
+    # Compute pairwise similarities a row at a time; Tanimoto rows are
+    # popcounts over bit-packed words, other metrics one bulk RDKit call
+    matrix = np.eye(n)
 
-    for i in range(n):
-        matrix[i][i] = 1.0
-        for j in range(i + 1, n):
-            sim = compute_similarity(
-                fps[i], fps[j], metric,
+    if metric == SimilarityMetric.TANIMOTO:
+        packed = pack_fingerprints(fps)
+        counts = count_bits(packed)
+
+    for i in range(n - 1):
+        if metric == SimilarityMetric.TANIMOTO:
+            row = packed_tanimoto_similarity(packed[i], packed[i + 1:], counts[i], counts[i + 1:])
+        else:
+            row = bulk_similarity(
+                fps[i], fps[i + 1:], metric,
                 tversky_alpha=tversky_alpha,
                 tversky_beta=tversky_beta,
             )
-            matrix[i][j] = sim
-            matrix[j][i] = sim
+        matrix[i, i + 1:] = row
+        matrix[i + 1:, i] = row
 
-    return matrix
+    return matrix.tolist()
 
 
 class ShapeSimilaritySearcher:
@@ -301,22 +416,25 @@ def cluster_molecules(
         List of clusters (each cluster is a list of molecule indices)
     """
     # Generate fingerprints
-    fps = []
-    valid_indices = []
-    for i, mol in enumerate(mols):
-        if mol is not None:
-            fps.append(get_morgan_fingerprint(mol, radius, n_bits))
-            valid_indices.append(i)
+    valid_indices = [i for i, mol in enumerate(mols) if mol is not None]
+    fps = get_morgan_fingerprints([mols[i] for i in valid_indices], radius, n_bits)
 
     n = len(fps)
     if n == 0:
         return []
 
-    # Compute distance matrix (lower triangle)
-    dists = []
-    for i in range(1, n):
-        sims = DataStructs.BulkTanimotoSimilarity(fps[i], fps[:i])
-        dists.extend([1 - s for s in sims])
+    import numpy as np
+
+    # Compute distance matrix (condensed lower triangle)
+    if n > 1:
+        packed = pack_fingerprints(fps)
+        counts = count_bits(packed)
+        dists = 1.0 - np.concatenate([
+            packed_tanimoto_similarity(packed[i], packed[:i], counts[i], counts[:i])
+            for i in range(1, n)
+        ])
+    else:
+        dists = np.empty(0)
 
     # Cluster using Butina
     clusters = Butina.ClusterData(dists, n, cutoff, isDistData=True)
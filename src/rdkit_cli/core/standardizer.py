@@ -1,15 +1,33 @@
 """Molecule standardization engine."""
 
-from typing import Optional, Any
+import time
+from typing import Callable, Optional, Any
 
 from rdkit import Chem
 from rdkit.Chem import AllChem
 from rdkit.Chem.MolStandardize import rdMolStandardize
 
 from rdkit_cli.io.readers import MoleculeRecord
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
 
-class MoleculeStandardizer:
+CANONICAL_FORMS = ("smiles", "kekule", "inchi")
+
+
+def _renumber_canonical(mol: Chem.Mol) -> Chem.Mol:
+    """Renumber atoms into canonical rank order."""
+    ranks = list(Chem.CanonicalRankAtoms(mol))
+    order = sorted(range(len(ranks)), key=ranks.__getitem__)
+    return Chem.RenumberAtoms(mol, order)
+
+
+def _remove_stereo(mol: Chem.Mol) -> Chem.Mol:
+    """Remove stereochemistry in place and return the molecule."""
+    Chem.RemoveStereochemistry(mol)
+    return mol
+
+
+class MoleculeStandardizer(RebuildOnUnpickle):
     """Standardizer for molecular structures."""
 
     def __init__(
@@ -23,6 +41,9 @@ class MoleculeStandardizer:
         fragment_parent: bool = False,
         tautomer_parent: bool = False,
         include_original: bool = False,
+        canonical_form: str = "smiles",
+        add_inchikey: bool = False,
+        profile: bool = False,
     ):
         """
         Initialize standardizer.
@@ -37,7 +58,18 @@ class MoleculeStandardizer:
             fragment_parent: Keep only largest fragment
             tautomer_parent: Canonicalize tautomer
             include_original: Include original SMILES in output
+            canonical_form: Output form: "smiles", "kekule" or "inchi"
+                (SMILES regenerated from the InChI, stable under atom order)
+            add_inchikey: Add InChIKey of the standardized molecule to output
+            profile: Time each step and report it under the "_timings" key
+                (nanoseconds per step) of every result
         """
+        if canonical_form not in CANONICAL_FORMS:
+            raise ValueError(
+                f"Unknown canonical form: {canonical_form}. "
+                f"Available: {', '.join(CANONICAL_FORMS)}"
+            )
+
         self.canonicalize = canonicalize
         self.remove_stereo = remove_stereo
         self.disconnect_metals = disconnect_metals
@@ -47,14 +79,75 @@ class MoleculeStandardizer:
         self.fragment_parent = fragment_parent
         self.tautomer_parent = tautomer_parent
         self.include_original = include_original
-
-        # Initialize standardizers
-        self._metal_disconnector = rdMolStandardize.MetalDisconnector() if disconnect_metals else None
-        self._normalizer = rdMolStandardize.Normalizer() if normalize else None
-        self._reionizer = rdMolStandardize.Reionizer() if reionize else None
-        self._uncharger = rdMolStandardize.Uncharger() if uncharge else None
-        self._fragment_chooser = rdMolStandardize.LargestFragmentChooser() if fragment_parent else None
-        self._tautomer_canon = rdMolStandardize.TautomerCanonicalizer() if tautomer_parent else None
+        self.canonical_form = canonical_form
+        self.add_inchikey = add_inchikey
+        self.profile = profile
+
+        self._build_pipeline()
+
+    def _build_pipeline(self):
+        """Create RDKit standardizers and the list of enabled transform steps."""
+        self._metal_disconnector = (
+            rdMolStandardize.MetalDisconnector() if self.disconnect_metals else None
+        )
+        self._normalizer = rdMolStandardize.Normalizer() if self.normalize else None
+        self._reionizer = rdMolStandardize.Reionizer() if self.reionize else None
+        self._uncharger = rdMolStandardize.Uncharger() if self.uncharge else None
+        self._fragment_chooser = (
+            rdMolStandardize.LargestFragmentChooser() if self.fragment_parent else None
+        )
+        self._tautomer_canon = (
+            rdMolStandardize.TautomerEnumerator() if self.tautomer_parent else None
+        )
+
+        # Only enabled steps, in application order, so the per-molecule loop has no flag checks
+        steps: list[tuple[str, Callable[[Chem.Mol], Chem.Mol]]] = []
+        if self._metal_disconnector:
+            steps.append(("disconnect_metals", self._metal_disconnector.Disconnect))
+        if self._normalizer:
+            steps.append(("normalize", self._normalizer.normalize))
+        if self._reionizer:
+            steps.append(("reionize", self._reionizer.reionize))
+        if self._uncharger:
+            steps.append(("uncharge", self._uncharger.uncharge))
+        if self._fragment_chooser:
+            steps.append(("fragment_parent", self._fragment_chooser.choose))
+        if self._tautomer_canon:
+            steps.append(("tautomer_parent", self._canonicalize_tautomer))
+        if self.remove_stereo:
+            steps.append(("remove_stereo", _remove_stereo))
+
+        if self.profile:
+            steps = [(name, self._timed(name, step)) for name, step in steps]
+        self._pipeline = [step for _, step in steps]
+        self._timings: dict[str, int] = {}
+
+        self.has_transforms = bool(self._pipeline)
+        # Nothing to change: input SMILES are written through untouched
+        self._passthrough = (
+            not self.has_transforms and not self.canonicalize and self.canonical_form == "smiles"
+        )
+
+    def _rebuild(self):
+        # RDKit standardizer objects cannot be pickled
+        self._build_pipeline()
+
+    def _timed(
+        self,
+        name: str,
+        step: Callable[[Chem.Mol], Chem.Mol],
+    ) -> Callable[[Chem.Mol], Chem.Mol]:
+        """Wrap a step so its run time is recorded in the current timings."""
+        def run(mol: Chem.Mol) -> Chem.Mol:
+            start = time.perf_counter_ns()
+            mol = step(mol)
+            self._timings[name] = time.perf_counter_ns() - start
+            return mol
+        return run
+
+    def _canonicalize_tautomer(self, mol: Chem.Mol) -> Chem.Mol:
+        """Canonicalize tautomer after renumbering (the result is atom-order dependent)."""
+        return self._tautomer_canon.Canonicalize(_renumber_canonical(mol))
 
     def standardize(self, record: MoleculeRecord) -> Optional[dict[str, Any]]:
         """
@@ -69,51 +162,60 @@ class MoleculeStandardizer:
         if record.mol is None:
             return None
 
+        if self._passthrough:
+            return self._make_result(record, record.smiles, record.mol)
+
         try:
             mol = record.mol
+            if self.profile:
+                self._timings = {}
 
-            # Apply transformations in order
-            if self._metal_disconnector:
-                mol = self._metal_disconnector.Disconnect(mol)
-
-            if self._normalizer:
-                mol = self._normalizer.normalize(mol)
-
-            if self._reionizer:
-                mol = self._reionizer.reionize(mol)
-
-            if self._uncharger:
-                mol = self._uncharger.uncharge(mol)
-
-            if self._fragment_chooser:
-                mol = self._fragment_chooser.choose(mol)
-
-            if self._tautomer_canon:
-                mol = self._tautomer_canon.canonicalize(mol)
-
-            if self.remove_stereo:
-                Chem.RemoveStereochemistry(mol)
+            # Apply enabled transformations in order
+            for step in self._pipeline:
+                mol = step(mol)
 
             # Generate output SMILES
-            if self.canonicalize:
-                output_smiles = Chem.MolToSmiles(mol, canonical=True)
-            else:
-                output_smiles = Chem.MolToSmiles(mol)
+            start = time.perf_counter_ns() if self.profile else 0
+            if self.canonical_form == "inchi":
+                mol = Chem.MolFromInchi(Chem.MolToInchi(mol))
+                if mol is None:
+                    return None
+            elif self.canonical_form == "kekule":
+                mol = Chem.Mol(mol)
+                Chem.Kekulize(mol, clearAromaticFlags=True)
+
+            output_smiles = Chem.MolToSmiles(mol, canonical=self.canonicalize)
+
+            result = self._make_result(record, output_smiles, mol)
+            if self.profile:
+                self._timings["output"] = time.perf_counter_ns() - start
+                result["_timings"] = self._timings
+            return result
+
+        except Exception:
+            return None
 
-            result: dict[str, Any] = {}
+    def _make_result(
+        self,
+        record: MoleculeRecord,
+        output_smiles: str,
+        mol: Chem.Mol,
+    ) -> dict[str, Any]:
+        """Build the output row for a standardized record."""
+        result: dict[str, Any] = {}
 
-            if self.include_original:
-                result["original_smiles"] = record.smiles
+        if self.include_original:
+            result["original_smiles"] = record.smiles
 
-            result["smiles"] = output_smiles
+        result["smiles"] = output_smiles
 
-            if record.name:
-                result["name"] = record.name
+        if record.name:
+            result["name"] = record.name
 
-            return result
+        if self.add_inchikey:
+            result["inchikey"] = Chem.MolToInchiKey(mol)
 
-        except Exception:
-            return None
+        return result
 
     def get_column_names(self) -> list[str]:
         """Get output column names in order."""
@@ -122,6 +224,8 @@ class MoleculeStandardizer:
             cols.append("original_smiles")
         cols.append("smiles")
         cols.append("name")
+        if self.add_inchikey:
+            cols.append("inchikey")
         return cols
 
 
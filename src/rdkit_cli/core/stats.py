@@ -45,7 +45,7 @@ class DatasetStatistics:
         Returns:
             Dictionary with statistics
         """
-        import statistics
+        import numpy as np
 
         # Count valid/invalid
         valid_mols = [m for m in mols if m is not None]
@@ -79,12 +79,13 @@ class DatasetStatistics:
                     pass
 
             if values:
+                arr = np.asarray(values, dtype=np.float64)
                 result[f"{prop_name}_min"] = round(min(values), 2)
                 result[f"{prop_name}_max"] = round(max(values), 2)
-                result[f"{prop_name}_mean"] = round(statistics.mean(values), 2)
-                result[f"{prop_name}_median"] = round(statistics.median(values), 2)
+                result[f"{prop_name}_mean"] = round(float(arr.mean()), 2)
+                result[f"{prop_name}_median"] = round(float(np.median(arr)), 2)
                 if len(values) > 1:
-                    result[f"{prop_name}_stdev"] = round(statistics.stdev(values), 2)
+                    result[f"{prop_name}_stdev"] = round(float(arr.std(ddof=1)), 2)
                 else:
                     result[f"{prop_name}_stdev"] = 0.0
 
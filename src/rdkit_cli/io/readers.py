@@ -10,6 +10,21 @@ from rdkit import Chem
 
 from rdkit_cli.io.formats import FileFormat, FormatConfig, detect_format
 
+# Buffer size for streaming text input; large reads suit narrow-line files
+READ_BUFFER_SIZE = 1 << 20
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines by scanning the file in large binary blocks."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb", buffering=0) as f:
+        while block := f.read(READ_BUFFER_SIZE):
+            count += block.count(b"\n")
+            last = block[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
 
 def _warn_parse_failed(row_idx: int, smiles: str, max_len: int = 50):
     """Print a warning for failed SMILES parsing if warnings are enabled."""
@@ -78,20 +93,20 @@ class CSVReader(MoleculeReader):
         name_column: Optional[str] = None,
         delimiter: str = ",",
         has_header: bool = True,
+        sanitize: bool = True,
     ):
         self.path = Path(path)
         self.smiles_column = smiles_column
         self.name_column = name_column
         self.delimiter = delimiter
         self.has_header = has_header
+        self.sanitize = sanitize
         self._count: Optional[int] = None
         self._df: Optional[pd.DataFrame] = None
 
     def __len__(self) -> int:
         if self._count is None:
-            # Count lines efficiently
-            with open(self.path, "rb") as f:
-                self._count = sum(1 for _ in f) - (1 if self.has_header else 0)
+            self._count = _count_lines(self.path) - (1 if self.has_header else 0)
         return self._count
 
     def __iter__(self) -> Iterator[MoleculeRecord]:
@@ -118,7 +133,7 @@ class CSVReader(MoleculeReader):
                 mol = None
                 if smiles:
                     try:
-                        mol = Chem.MolFromSmiles(smiles)
+                        mol = Chem.MolFromSmiles(smiles, sanitize=self.sanitize)
                     except Exception:
                         pass
 
@@ -145,50 +160,120 @@ class SMIReader(MoleculeReader):
         path: Path | str,
         has_header: bool = False,
         delimiter: str = " ",
+        sanitize: bool = True,
+        byte_range: Optional[tuple[int, int]] = None,
+        first_row: int = 0,
     ):
         self.path = Path(path)
         self.has_header = has_header
         self.delimiter = delimiter
+        self.sanitize = sanitize
+        self.byte_range = byte_range
+        self.first_row = first_row
         self._count: Optional[int] = None
 
     def __len__(self) -> int:
         if self._count is None:
-            with open(self.path, "r") as f:
-                count = sum(1 for _ in f)
-            self._count = count - (1 if self.has_header else 0)
+            if self.byte_range is not None:
+                self._count = len(self._read_range())
+            else:
+                self._count = _count_lines(self.path) - (1 if self.has_header else 0)
         return self._count
 
     def __iter__(self) -> Iterator[MoleculeRecord]:
-        with open(self.path, "r") as f:
+        if self.byte_range is not None:
+            yield from self._parse_lines(self._read_range())
+            return
+
+        with open(self.path, "r", buffering=READ_BUFFER_SIZE) as f:
             if self.has_header:
                 next(f)
+            yield from self._parse_lines(f)
+
+    def _read_range(self) -> list[str]:
+        """Read the lines of this reader's byte range."""
+        start, end = self.byte_range
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("utf-8").splitlines()
+
+    def _parse_lines(self, lines) -> Iterator[MoleculeRecord]:
+        """Parse SMILES lines into records."""
+        for idx, line in enumerate(lines, start=self.first_row):
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split(self.delimiter, 1)
+            smiles = parts[0] if parts else ""
+            name = parts[1].strip() if len(parts) > 1 else ""
+
+            mol = None
+            if smiles:
+                try:
+                    mol = Chem.MolFromSmiles(smiles, sanitize=self.sanitize)
+                except Exception:
+                    pass
+
+            if mol is None and smiles:
+                _warn_parse_failed(idx + 1, smiles)
 
-            for idx, line in enumerate(f):
-                line = line.strip()
-                if not line:
-                    continue
+            yield MoleculeRecord(
+                mol=mol,
+                smiles=smiles,
+                name=name,
+                metadata={"smiles": smiles, "name": name},
+                row_idx=idx,
+            )
 
-                parts = line.split(self.delimiter, 1)
-                smiles = parts[0] if parts else ""
-                name = parts[1].strip() if len(parts) > 1 else ""
+    def split(self, n_shards: int) -> list["SMIReader"]:
+        """
+        Split the file into readers over line-aligned byte ranges.
 
-                mol = None
-                if smiles:
-                    try:
-                        mol = Chem.MolFromSmiles(smiles)
-                    except Exception:
-                        pass
+        The file is memory-mapped to locate line boundaries, so each shard
+        can be read and parsed independently (e.g. in a worker process).
 
-                if mol is None and smiles:
-                    _warn_parse_failed(idx + 1, smiles)
+        Args:
+            n_shards: Target number of shards
 
-                yield MoleculeRecord(
-                    mol=mol,
-                    smiles=smiles,
-                    name=name,
-                    metadata={"smiles": smiles, "name": name},
-                    row_idx=idx,
-                )
+        Returns:
+            List of readers covering the file in order
+        """
+        import mmap
+
+        size = self.path.stat().st_size
+        if size == 0:
+            return []
+
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            if self.has_header:
+                start = mm.find(b"\n") + 1
+                if start == 0:
+                    return []
+
+            bounds = [start]
+            step = max(1, (size - start) // max(1, n_shards))
+            for i in range(1, n_shards):
+                pos = mm.find(b"\n", max(bounds[-1], start + i * step)) + 1
+                if pos == 0 or pos >= size:
+                    break
+                bounds.append(pos)
+            bounds.append(size)
+
+            shards = []
+            row = 0
+            for shard_start, shard_end in zip(bounds[:-1], bounds[1:]):
+                shards.append(SMIReader(
+                    self.path,
+                    delimiter=self.delimiter,
+                    sanitize=self.sanitize,
+                    byte_range=(shard_start, shard_end),
+                    first_row=row,
+                ))
+                row += mm[shard_start:shard_end].count(b"\n")
+
+        return shards
 
     def close(self):
         pass
@@ -197,8 +282,9 @@ class SMIReader(MoleculeReader):
 class SDFReader(MoleculeReader):
     """Read molecules from SDF files."""
 
-    def __init__(self, path: Path | str):
+    def __init__(self, path: Path | str, sanitize: bool = True):
         self.path = Path(path)
+        self.sanitize = sanitize
         self._count: Optional[int] = None
 
     def __len__(self) -> int:
@@ -209,7 +295,7 @@ class SDFReader(MoleculeReader):
         return self._count
 
     def __iter__(self) -> Iterator[MoleculeRecord]:
-        supplier = Chem.SDMolSupplier(str(self.path))
+        supplier = Chem.SDMolSupplier(str(self.path), sanitize=self.sanitize)
 
         for idx, mol in enumerate(supplier):
             metadata = {}
@@ -246,10 +332,12 @@ class ParquetReader(MoleculeReader):
         path: Path | str,
         smiles_column: str = "smiles",
         name_column: Optional[str] = None,
+        sanitize: bool = True,
     ):
         self.path = Path(path)
         self.smiles_column = smiles_column
         self.name_column = name_column
+        self.sanitize = sanitize
         self._count: Optional[int] = None
 
     def __len__(self) -> int:
@@ -275,7 +363,7 @@ class ParquetReader(MoleculeReader):
                 mol = None
                 if smiles:
                     try:
-                        mol = Chem.MolFromSmiles(smiles)
+                        mol = Chem.MolFromSmiles(smiles, sanitize=self.sanitize)
                     except Exception:
                         pass
 
@@ -295,12 +383,38 @@ class ParquetReader(MoleculeReader):
         pass
 
 
+class UniqueSmilesReader(MoleculeReader):
+    """Wrap a reader and skip records whose input SMILES string was already seen."""
+
+    def __init__(self, reader: MoleculeReader):
+        self.reader = reader
+        self.n_duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self.reader)
+
+    def __iter__(self) -> Iterator[MoleculeRecord]:
+        seen: set[str] = set()
+
+        for record in self.reader:
+            if record.smiles:
+                if record.smiles in seen:
+                    self.n_duplicates += 1
+                    continue
+                seen.add(record.smiles)
+            yield record
+
+    def close(self):
+        self.reader.close()
+
+
 def create_reader(
     path: str | Path,
     format_config: Optional[FormatConfig] = None,
     smiles_column: str = "smiles",
     name_column: Optional[str] = None,
     has_header: Optional[bool] = None,
+    sanitize: bool = True,
 ) -> MoleculeReader:
     """
     Factory function to create appropriate reader.
@@ -311,6 +425,7 @@ def create_reader(
         smiles_column: Name of SMILES column (for CSV/Parquet)
         name_column: Name of name column
         has_header: Override header detection
+        sanitize: Sanitize parsed molecules (disable only for trusted input)
 
     Returns:
         Appropriate MoleculeReader instance
@@ -333,6 +448,7 @@ def create_reader(
             name_column=name_column,
             delimiter=",",
             has_header=has_header if has_header is not None else True,
+            sanitize=sanitize,
         )
     elif file_format == FileFormat.TSV:
         return CSVReader(
@@ -341,19 +457,22 @@ def create_reader(
             name_column=name_column,
             delimiter="\t",
             has_header=has_header if has_header is not None else True,
+            sanitize=sanitize,
         )
     elif file_format == FileFormat.SMI:
         return SMIReader(
             path,
             has_header=has_header if has_header is not None else False,
+            sanitize=sanitize,
         )
     elif file_format == FileFormat.SDF:
-        return SDFReader(path)
+        return SDFReader(path, sanitize=sanitize)
     elif file_format == FileFormat.PARQUET:
         return ParquetReader(
             path,
             smiles_column=smiles_column,
             name_column=name_column,
+            sanitize=sanitize,
         )
     else:
         raise ValueError(f"Unsupported format: {file_format}")
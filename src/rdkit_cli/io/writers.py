@@ -9,6 +9,9 @@ from rdkit import Chem
 
 from rdkit_cli.io.formats import FileFormat, detect_format
 
+# Output files use a large buffer so batches reach the OS in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class MoleculeWriter(ABC):
     """Abstract base class for molecule file writers."""
@@ -47,7 +50,7 @@ class CSVWriter(MoleculeWriter):
         self.path = Path(path)
         self.delimiter = delimiter
         self.columns = columns
-        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._file = open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
         self._header_written = False
         self._column_order: Optional[list[str]] = None
 
@@ -73,25 +76,28 @@ class CSVWriter(MoleculeWriter):
             self._header_written = True
 
         # Write data rows
+        lines = []
         for row in data:
             values = []
             for col in self._column_order:
                 val = row.get(col, "")
-                # Handle special types
+                # Numbers never need quoting; NaN (the only float != itself) is left empty
+                if type(val) is int:
+                    values.append(str(val))
+                    continue
+                if isinstance(val, float):
+                    values.append("" if val != val else str(val))
+                    continue
                 if val is None:
                     val = ""
-                elif isinstance(val, float):
-                    if pd.isna(val):
-                        val = ""
-                    else:
-                        val = str(val)
                 else:
                     val = str(val)
                 # Escape delimiter and quotes
                 if self.delimiter in val or '"' in val or "\n" in val:
                     val = '"' + val.replace('"', '""') + '"'
                 values.append(val)
-            self._file.write(self.delimiter.join(values) + "\n")
+            lines.append(self.delimiter.join(values) + "\n")
+        self._file.write("".join(lines))
 
     def close(self):
         """Close the file."""
@@ -112,23 +118,26 @@ class SMIWriter(MoleculeWriter):
         self.path = Path(path)
         self.smiles_column = smiles_column
         self.name_column = name_column
-        self._file = open(path, "w", encoding="utf-8")
+        self._file = open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
 
-    def write_row(self, data: dict[str, Any]):
-        """Write a single row."""
+    def _format_row(self, data: dict[str, Any]) -> str:
+        """Format a single row as a SMILES line (empty if no SMILES)."""
         smiles = data.get(self.smiles_column, "")
         name = data.get(self.name_column, "") if self.name_column else ""
 
-        if smiles:
-            if name:
-                self._file.write(f"{smiles} {name}\n")
-            else:
-                self._file.write(f"{smiles}\n")
+        if not smiles:
+            return ""
+        if name:
+            return f"{smiles} {name}\n"
+        return f"{smiles}\n"
+
+    def write_row(self, data: dict[str, Any]):
+        """Write a single row."""
+        self._file.write(self._format_row(data))
 
     def write_batch(self, data: list[dict[str, Any]]):
         """Write a batch of results."""
-        for row in data:
-            self.write_row(row)
+        self._file.write("".join(self._format_row(row) for row in data))
 
     def close(self):
         """Close the file."""
@@ -188,6 +197,7 @@ class ParquetWriter(MoleculeWriter):
         self.columns = columns
         self._batches: list[dict[str, Any]] = []
         self._batch_size = 100000  # Write in batches of 100k
+        self._writer = None
 
     def write_row(self, data: dict[str, Any]):
         """Write a single row."""
@@ -208,7 +218,7 @@ class ParquetWriter(MoleculeWriter):
             self._flush()
 
     def _flush(self):
-        """Write accumulated batches to file."""
+        """Write accumulated batches to the file as one row group."""
         if not self._batches:
             return
 
@@ -225,17 +235,125 @@ class ParquetWriter(MoleculeWriter):
 
         table = pa.Table.from_pandas(df, preserve_index=False)
 
-        if self.path.exists():
-            # Append to existing file
-            existing = pq.read_table(self.path)
-            table = pa.concat_tables([existing, table])
-
-        pq.write_table(table, self.path)
+        # Keep the file open and append row groups instead of re-reading it
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
         self._batches = []
 
     def close(self):
         """Finalize and close the file."""
         self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class NpzWriter(MoleculeWriter):
+    """Write packed fingerprint arrays to a NumPy .npz archive."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        columns: Optional[list[str]] = None,
+        array_column: str = "fingerprint",
+        attrs: Optional[dict[str, Any]] = None,
+    ):
+        self.path = Path(path)
+        self.columns = columns
+        self.array_column = array_column
+        self.attrs = attrs or {}
+        self._rows: list[dict[str, Any]] = []
+
+    def write_row(self, data: dict[str, Any]):
+        """Write a single row."""
+        self._rows.append(data)
+
+    def write_batch(self, data: list[dict[str, Any]]):
+        """Write a batch of results."""
+        self._rows.extend(data)
+
+    def close(self):
+        """Stack the collected rows into one array per column and save them."""
+        import numpy as np
+
+        arrays: dict[str, Any] = dict(self.attrs)
+        if self._rows:
+            arrays[self.array_column] = np.stack([row[self.array_column] for row in self._rows])
+        else:
+            arrays[self.array_column] = np.empty((0, 0), dtype=np.uint8)
+
+        for col in self.columns or []:
+            if col != self.array_column:
+                arrays[col] = np.array([row.get(col, "") for row in self._rows], dtype=str)
+
+        # Save through a file object so np.savez keeps the given file name
+        with open(self.path, "wb") as f:
+            np.savez(f, **arrays)
+        self._rows = []
+
+
+class UniqueKeyWriter(MoleculeWriter):
+    """Wrap a writer and drop rows whose key column value was already written."""
+
+    def __init__(self, writer: MoleculeWriter, key_column: str):
+        self.writer = writer
+        self.key_column = key_column
+        self.n_duplicates = 0
+        self._seen: set[str] = set()
+
+    def _is_new(self, data: dict[str, Any]) -> bool:
+        key = data.get(self.key_column)
+        if not key:
+            return True
+        if key in self._seen:
+            self.n_duplicates += 1
+            return False
+        self._seen.add(key)
+        return True
+
+    def write_row(self, data: dict[str, Any]):
+        """Write a single row unless it is a duplicate."""
+        if self._is_new(data):
+            self.writer.write_row(data)
+
+    def write_batch(self, data: list[dict[str, Any]]):
+        """Write a batch of results, skipping duplicates."""
+        self.writer.write_batch([row for row in data if self._is_new(row)])
+
+    def close(self):
+        """Close the wrapped writer."""
+        self.writer.close()
+
+
+class TimingWriter(MoleculeWriter):
+    """Wrap a writer and aggregate per-row timing dicts before writing rows."""
+
+    def __init__(self, writer: MoleculeWriter, timings_key: str = "_timings"):
+        self.writer = writer
+        self.timings_key = timings_key
+        self.totals: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+    def _collect(self, data: dict[str, Any]) -> dict[str, Any]:
+        timings = data.pop(self.timings_key, None)
+        if timings:
+            for name, value in timings.items():
+                self.totals[name] = self.totals.get(name, 0) + value
+                self.counts[name] = self.counts.get(name, 0) + 1
+        return data
+
+    def write_row(self, data: dict[str, Any]):
+        """Write a single row."""
+        self.writer.write_row(self._collect(data))
+
+    def write_batch(self, data: list[dict[str, Any]]):
+        """Write a batch of results."""
+        self.writer.write_batch([self._collect(row) for row in data])
+
+    def close(self):
+        """Close the wrapped writer."""
+        self.writer.close()
 
 
 def create_writer(
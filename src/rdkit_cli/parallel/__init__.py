@@ -1,5 +1,6 @@
 """Parallel processing utilities."""
 
 from rdkit_cli.parallel.executor import ParallelExecutor, parallel_map
+from rdkit_cli.parallel.state import RebuildOnUnpickle
 
-__all__ = ["ParallelExecutor", "parallel_map"]
+__all__ = ["ParallelExecutor", "parallel_map", "RebuildOnUnpickle"]
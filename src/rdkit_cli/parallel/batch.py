@@ -1,12 +1,17 @@
 """Batch processing utilities."""
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Any, Optional
 
-from rdkit_cli.io.readers import MoleculeReader, MoleculeRecord
+from rdkit_cli.io.readers import MoleculeReader, MoleculeRecord, SMIReader
 from rdkit_cli.io.writers import MoleculeWriter
 from rdkit_cli.progress.ninja import NinjaProgress
-from rdkit_cli.parallel.executor import ParallelExecutor
+from rdkit_cli.parallel.executor import ParallelExecutor, get_worker_count
+
+# Upper bound on bytes parsed per shard, keeping per-worker result lists small
+SHARD_BYTES = 4 << 20
 
 
 @dataclass
@@ -26,6 +31,7 @@ def process_molecules(
     n_workers: int = -1,
     quiet: bool = False,
     batch_size: int = 1000,
+    backend: str = "process",
 ) -> BatchResult:
     """
     Process molecules from reader through processor and write to writer.
@@ -39,6 +45,7 @@ def process_molecules(
         n_workers: Number of worker processes (-1 for all)
         quiet: Suppress progress output
         batch_size: Number of records to process in each batch
+        backend: Parallel backend ("process" or "joblib")
 
     Returns:
         BatchResult with processing statistics
@@ -49,7 +56,7 @@ def process_molecules(
     successful = 0
     failed = 0
     write_buffer: list[dict[str, Any]] = []
-    write_buffer_size = 1000
+    write_buffer_size = 4096
 
     progress.start()
 
@@ -70,15 +77,33 @@ def process_molecules(
                     writer.write_batch(write_buffer)
                     write_buffer = []
         else:
-            # Parallel processing - collect batch, process in parallel, write
-            executor = ParallelExecutor(processor, n_workers=n_workers)
-            batch: list[MoleculeRecord] = []
-
-            for record in reader:
-                batch.append(record)
-
-                if len(batch) >= batch_size:
-                    # Process batch in parallel
+            # Parallel processing - collect batch, process in parallel, write.
+            # One worker pool serves every batch.
+            with ParallelExecutor(processor, n_workers=n_workers, backend=backend) as executor:
+                batch: list[MoleculeRecord] = []
+
+                for record in reader:
+                    batch.append(record)
+
+                    if len(batch) >= batch_size:
+                        # Process batch in parallel
+                        results = executor.map_ordered(batch)
+                        for result in results:
+                            if result is not None:
+                                write_buffer.append(result)
+                                successful += 1
+                            else:
+                                failed += 1
+                            progress.update()
+
+                        if len(write_buffer) >= write_buffer_size:
+                            writer.write_batch(write_buffer)
+                            write_buffer = []
+
+                        batch = []
+
+                # Process remaining batch
+                if batch:
                     results = executor.map_ordered(batch)
                     for result in results:
                         if result is not None:
@@ -88,23 +113,6 @@ def process_molecules(
                             failed += 1
                         progress.update()
 
-                    if len(write_buffer) >= write_buffer_size:
-                        writer.write_batch(write_buffer)
-                        write_buffer = []
-
-                    batch = []
-
-            # Process remaining batch
-            if batch:
-                results = executor.map_ordered(batch)
-                for result in results:
-                    if result is not None:
-                        write_buffer.append(result)
-                        successful += 1
-                    else:
-                        failed += 1
-                    progress.update()
-
         # Write remaining buffer
         if write_buffer:
             writer.write_batch(write_buffer)
@@ -120,6 +128,69 @@ def process_molecules(
     )
 
 
+def _process_shard(
+    reader: MoleculeReader,
+    processor: Callable[[MoleculeRecord], Optional[dict[str, Any]]],
+) -> list[Optional[dict[str, Any]]]:
+    """Read and process one shard inside a worker process."""
+    return [processor(record) for record in reader]
+
+
+def process_molecules_sharded(
+    reader: SMIReader,
+    writer: MoleculeWriter,
+    processor: Callable[[MoleculeRecord], Optional[dict[str, Any]]],
+    n_workers: int = -1,
+    quiet: bool = False,
+) -> BatchResult:
+    """
+    Process a SMILES file by letting each worker read its own byte range.
+
+    Unlike process_molecules, the parent never parses or pickles molecules:
+    workers receive line-aligned shards, parse them, and return results,
+    which are written in input order.
+
+    Args:
+        reader: SMIReader over the whole input file
+        writer: MoleculeWriter to write to
+        processor: Function that takes MoleculeRecord and returns dict or None
+        n_workers: Number of worker processes (-1 for all)
+        quiet: Suppress progress output
+
+    Returns:
+        BatchResult with processing statistics
+    """
+    n_workers = get_worker_count(n_workers)
+    n_shards = max(n_workers * 4, reader.path.stat().st_size // SHARD_BYTES + 1)
+    shards = reader.split(n_shards)
+
+    total = len(reader)
+    progress = NinjaProgress(total=total, quiet=quiet)
+
+    successful = 0
+    failed = 0
+
+    progress.start()
+
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for results in executor.map(partial(_process_shard, processor=processor), shards):
+                write_buffer = [result for result in results if result is not None]
+                successful += len(write_buffer)
+                failed += len(results) - len(write_buffer)
+                writer.write_batch(write_buffer)
+                progress.update(len(results))
+    finally:
+        progress.finish()
+
+    return BatchResult(
+        total_processed=total,
+        successful=successful,
+        failed=failed,
+        elapsed_time=progress.elapsed_time,
+    )
+
+
 def process_molecules_simple(
     reader: MoleculeReader,
     processor: Callable[[MoleculeRecord], Optional[dict[str, Any]]],
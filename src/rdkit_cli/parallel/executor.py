@@ -8,6 +8,9 @@ from dataclasses import dataclass
 T = TypeVar("T")
 R = TypeVar("R")
 
+# Supported parallel backends
+BACKENDS = ("process", "joblib")
+
 
 @dataclass
 class ParallelConfig:
@@ -26,15 +29,15 @@ def get_worker_count(n_requested: int) -> int:
     Get actual worker count based on request and system.
 
     Args:
-        n_requested: Requested number of workers (-1 for all, 0 for 1)
+        n_requested: Requested number of workers (-1 for all, 0 for in-process)
 
     Returns:
-        Actual number of workers to use
+        Actual number of workers to use; 1 means in-process
     """
     max_workers = os.cpu_count() or 1
-    if n_requested <= 0:
+    if n_requested < 0:
         return max_workers
-    return min(n_requested, max_workers)
+    return min(max(n_requested, 1), max_workers)
 
 
 # Global worker function storage for pickling
@@ -61,8 +64,12 @@ class ParallelExecutor:
     """
     Generic parallel executor for batch processing.
 
-    Uses ProcessPoolExecutor since RDKit operations are CPU-bound
-    and benefit from true parallelism (bypassing GIL).
+    Uses ProcessPoolExecutor by default since RDKit operations are CPU-bound
+    and benefit from true parallelism (bypassing GIL). The "joblib" backend
+    uses loky's reusable worker pool (requires joblib).
+
+    Used as a context manager, the executor keeps one worker pool open so
+    repeated map_ordered calls do not start new workers each time.
     """
 
     def __init__(
@@ -71,6 +78,7 @@ class ParallelExecutor:
         n_workers: int = -1,
         initializer: Optional[Callable] = None,
         initargs: tuple = (),
+        backend: str = "process",
     ):
         """
         Initialize parallel executor.
@@ -80,11 +88,31 @@ class ParallelExecutor:
             n_workers: Number of worker processes (-1 for all CPUs)
             initializer: Optional initializer for worker processes
             initargs: Arguments for initializer
+            backend: Parallel backend ("process" or "joblib")
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}. Available: {', '.join(BACKENDS)}")
+
         self.func = func
         self.n_workers = get_worker_count(n_workers)
         self.initializer = initializer
         self.initargs = initargs
+        self.backend = backend
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelExecutor":
+        if self.n_workers > 1 and self.backend != "joblib":
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def map_unordered(
         self,
@@ -150,8 +178,29 @@ class ParallelExecutor:
         if len(items) == 1 or self.n_workers == 1:
             return [self.func(item) for item in items]
 
+        chunksize = max(1, len(items) // (self.n_workers * 4))
+
+        if self._pool is not None:
+            return list(self._pool.map(self.func, items, chunksize=chunksize))
+
+        if self.backend == "joblib":
+            return self._map_joblib(items, chunksize)
+
         with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
-            return list(executor.map(self.func, items, chunksize=max(1, len(items) // (self.n_workers * 4))))
+            return list(executor.map(self.func, items, chunksize=chunksize))
+
+    def _map_joblib(self, items: list[T], chunksize: int) -> list[R]:
+        """Process items with joblib's loky backend, which reuses workers across calls."""
+        try:
+            from joblib import Parallel, delayed
+        except ImportError as e:
+            raise ImportError(
+                "The joblib backend requires joblib (pip install 'rdkit-cli[joblib]')"
+            ) from e
+
+        return Parallel(n_jobs=self.n_workers, backend="loky", batch_size=chunksize)(
+            delayed(self.func)(item) for item in items
+        )
 
 
 def parallel_map(
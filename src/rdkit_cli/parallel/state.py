@@ -0,0 +1,24 @@
+"""Pickling support for engines sent to worker processes."""
+
+from typing import Any
+
+
+class RebuildOnUnpickle:
+    """
+    Mixin for engines that hold RDKit objects which cannot be pickled.
+
+    Private attributes (leading underscore) are left out of the pickled
+    state; after unpickling in a worker, _rebuild() recreates them from the
+    public configuration attributes.
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recreate private state from the public attributes."""
+        raise NotImplementedError
@@ -1,8 +1,6 @@
 """Pytest configuration and fixtures."""
 
 import pytest
-from pathlib import Path
-import tempfile
 
 
 # Sample molecules for testing
@@ -14,6 +12,10 @@ SAMPLE_SMILES = [
     ("acetone", "CC(=O)C"),
 ]
 
+# File contents are built once so fixtures write each file in a single call
+SAMPLE_CSV = "smiles,name\n" + "".join(f"{smi},{name}\n" for name, smi in SAMPLE_SMILES)
+SAMPLE_SMI = "".join(f"{smi} {name}\n" for name, smi in SAMPLE_SMILES)
+
 INVALID_SMILES = [
     "not_a_smiles",
     "C(C(C)",
@@ -28,21 +30,28 @@ def sample_molecules():
 
 
 @pytest.fixture
-def tmp_dir():
-    """Create a temporary directory."""
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
+def tmp_dir(tmp_path):
+    """Create a temporary directory.
+
+    Backed by pytest's tmp_path, whose retention policy removes old runs,
+    so there is no per-test cleanup.
+    """
+    return tmp_path
 
 
 @pytest.fixture
 def sample_csv(tmp_dir):
     """Create a sample CSV file with molecules."""
-    import pandas as pd
-
     csv_path = tmp_dir / "sample.csv"
-    df = pd.DataFrame(SAMPLE_SMILES, columns=["name", "smiles"])
-    df = df[["smiles", "name"]]  # Reorder columns
-    df.to_csv(csv_path, index=False)
+    csv_path.write_text(SAMPLE_CSV)
+    return csv_path
+
+
+@pytest.fixture(scope="session")
+def shared_sample_csv(tmp_path_factory):
+    """Create a session-wide sample CSV file. Tests must treat it as read-only."""
+    csv_path = tmp_path_factory.mktemp("shared") / "sample.csv"
+    csv_path.write_text(SAMPLE_CSV)
     return csv_path
 
 
@@ -50,11 +59,7 @@ def sample_csv(tmp_dir):
 def sample_csv_with_invalid(tmp_dir):
     """Create a CSV file with some invalid molecules."""
     csv_path = tmp_dir / "sample_invalid.csv"
-    all_smiles = SAMPLE_SMILES + [("invalid", "not_a_smiles")]
-    with open(csv_path, "w") as f:
-        f.write("smiles,name\n")
-        for name, smiles in all_smiles:
-            f.write(f"{smiles},{name}\n")
+    csv_path.write_text(SAMPLE_CSV + "not_a_smiles,invalid\n")
     return csv_path
 
 
@@ -62,9 +67,7 @@ def sample_csv_with_invalid(tmp_dir):
 def sample_smi(tmp_dir):
     """Create a sample SMI file."""
     smi_path = tmp_dir / "sample.smi"
-    with open(smi_path, "w") as f:
-        for name, smi in SAMPLE_SMILES:
-            f.write(f"{smi} {name}\n")
+    smi_path.write_text(SAMPLE_SMI)
     return smi_path
 
 
@@ -102,7 +105,7 @@ def output_sdf(tmp_dir):
 def output_dir(tmp_dir):
     """Return a path for output directory."""
     d = tmp_dir / "output_dir"
-    d.mkdir(exist_ok=True)
+    d.mkdir()
     return d
 
 
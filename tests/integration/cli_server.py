@@ -0,0 +1,152 @@
+"""Shared rdkit-cli process for integration tests.
+
+Starting a fresh interpreter and importing RDKit for every CLI invocation
+dominates integration test time. This module keeps one long-lived driver
+process per test session: each call sends an argv list as a JSON line and
+reads back the return code (and, on request, the captured output) as a JSON
+line. If the driver cannot be used, calls fall back to a plain subprocess.
+
+Run as a script, the module acts as the driver itself.
+"""
+
+import atexit
+import io
+import json
+import os
+import select
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Optional
+
+# Resolved once at import rather than on every call. Processes are spawned
+# with close_fds=False: Python's own descriptors are non-inheritable already
+# (PEP 446), and it lets CPython use its posix_spawn fast path on Linux.
+_CLI_PREFIX = (sys.executable, "-m", "rdkit_cli")
+_DRIVER_CMD = (sys.executable, str(Path(__file__).resolve()))
+
+_server: Optional[subprocess.Popen] = None
+
+
+def _start_server() -> Optional[subprocess.Popen]:
+    """Start the driver process, or return None if it is unavailable."""
+    try:
+        proc = subprocess.Popen(
+            _DRIVER_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            close_fds=False,
+        )
+    except OSError:
+        return None
+    atexit.register(_stop_server, proc)
+    return proc
+
+
+def _stop_server(proc: subprocess.Popen):
+    """Close the driver's input so it exits, killing it if it does not."""
+    if proc.poll() is None:
+        proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _run_subprocess(
+    cmd: tuple[str, ...], timeout: int, capture: bool
+) -> subprocess.CompletedProcess:
+    """Run the CLI in a fresh process."""
+    if capture:
+        return subprocess.run(
+            cmd, capture_output=True, text=True, timeout=timeout, close_fds=False
+        )
+    return subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout,
+        close_fds=False,
+    )
+
+
+def run_cli(
+    args: list[str], timeout: int = 120, capture: bool = False
+) -> subprocess.CompletedProcess:
+    """Run rdkit-cli command and return result.
+
+    Args:
+        args: Command-line arguments (without the program name)
+        timeout: Seconds to wait for the command
+        capture: Return stdout/stderr on the result; otherwise both are None
+
+    Returns:
+        Completed process with the command's return code
+    """
+    global _server
+
+    cmd = (*_CLI_PREFIX, *args)
+
+    if _server is None or _server.poll() is not None:
+        _server = _start_server()
+    if _server is None:
+        return _run_subprocess(cmd, timeout, capture)
+
+    try:
+        _server.stdin.write(json.dumps({"args": args, "capture": capture}) + "\n")
+        _server.stdin.flush()
+    except (BrokenPipeError, OSError):
+        _server = None
+        return _run_subprocess(cmd, timeout, capture)
+
+    ready, _, _ = select.select([_server.stdout], [], [], timeout)
+    if not ready:
+        _server.kill()
+        _server = None
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    line = _server.stdout.readline()
+    if not line:
+        # Driver died mid-command (e.g. a crash in native code); retry in isolation
+        _server = None
+        return _run_subprocess(cmd, timeout, capture)
+
+    reply = json.loads(line)
+    return subprocess.CompletedProcess(
+        cmd, reply["returncode"], reply.get("stdout"), reply.get("stderr")
+    )
+
+
+def _serve():
+    """Driver loop: run one CLI invocation per JSON line on stdin."""
+    from rdkit_cli.cli import main
+    from rdkit_cli.utils import configure_all_warnings
+
+    # Reply on a private copy of fd 1; native code (RDKit logging) writing
+    # straight to fd 1 is sent to stderr so it cannot corrupt the protocol
+    channel = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        # Each invocation starts from default warning settings
+        configure_all_warnings(suppress=False)
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                returncode = main(request["args"])
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+
+        reply = {"returncode": returncode}
+        if request["capture"]:
+            reply["stdout"] = stdout.getvalue()
+            reply["stderr"] = stderr.getvalue()
+        channel.write(json.dumps(reply) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__":
+    _serve()
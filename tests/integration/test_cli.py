@@ -1,15 +1,8 @@
 """Integration tests for CLI commands."""
 
 import pytest
-import subprocess
-import sys
-from pathlib import Path
 
-
-def run_cli(args: list[str], input_file: Path = None) -> subprocess.CompletedProcess:
-    """Run rdkit-cli command and return result."""
-    cmd = [sys.executable, "-m", "rdkit_cli"] + args
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+from tests.integration.cli_server import run_cli
 
 
 class TestDescriptorsCommand:
@@ -17,13 +10,13 @@ class TestDescriptorsCommand:
 
     def test_list_descriptors(self):
         """Test listing descriptors."""
-        result = run_cli(["descriptors", "list"])
+        result = run_cli(["descriptors", "list"], capture=True)
         assert result.returncode == 0
         assert "MolWt" in result.stdout
 
     def test_list_descriptors_all(self):
         """Test listing all descriptors."""
-        result = run_cli(["descriptors", "list", "--all"])
+        result = run_cli(["descriptors", "list", "--all"], capture=True)
         assert result.returncode == 0
         # Should have many lines
         assert len(result.stdout.split("\n")) > 50
@@ -50,7 +43,7 @@ class TestFingerprintsCommand:
 
     def test_list_fingerprints(self):
         """Test listing fingerprints."""
-        result = run_cli(["fingerprints", "list"])
+        result = run_cli(["fingerprints", "list"], capture=True)
         assert result.returncode == 0
         assert "morgan" in result.stdout.lower()
 
@@ -66,6 +59,34 @@ class TestFingerprintsCommand:
         assert result.returncode == 0
         assert output_csv.exists()
 
+    def test_numpy_format_requires_npz_output(self, sample_csv, output_csv):
+        """Test --format numpy rejects output paths that are not .npz."""
+        result = run_cli([
+            "fingerprints", "compute",
+            "-i", str(sample_csv),
+            "-o", str(output_csv),
+            "--format", "numpy",
+        ], capture=True)
+        assert result.returncode == 1
+        assert ".npz" in result.stderr
+        assert not output_csv.exists()
+
+    def test_numpy_format_npz_output(self, sample_csv, tmp_dir):
+        """Test --format numpy writes an .npz archive."""
+        import numpy as np
+
+        output_npz = tmp_dir / "fps.npz"
+        result = run_cli([
+            "fingerprints", "compute",
+            "-i", str(sample_csv),
+            "-o", str(output_npz),
+            "--format", "numpy",
+            "-q",
+        ])
+        assert result.returncode == 0
+        with np.load(output_npz) as archive:
+            assert len(archive["smiles"]) == 5
+
 
 class TestFilterCommand:
     """Test filter command."""
@@ -271,16 +292,87 @@ class TestStandardizeCommand:
         assert output_csv.exists()
 
     def test_standardize_with_options(self, sample_csv, output_csv):
-        """Test standardization with options."""
+        """Test standardization with every pipeline transform enabled in one run."""
         result = run_cli([
             "standardize",
             "-i", str(sample_csv),
             "-o", str(output_csv),
+            "--cleanup",
             "--fragment-parent",
-            "-n", "1",  # Single process to avoid pickling issues
+            "--uncharge",
+            "--tautomer-parent",
+            "--remove-stereo",
+            "-n", "1",
+            "-q",
+        ])
+        assert result.returncode == 0
+        assert len(output_csv.read_text().strip().split("\n")) == 6
+
+    def test_standardize_in_process(self, sample_csv, output_csv):
+        """Test that -n 0 runs in-process and still writes all molecules."""
+        result = run_cli([
+            "standardize",
+            "-i", str(sample_csv),
+            "-o", str(output_csv),
+            "-n", "0",
+            "-q",
+        ])
+        assert result.returncode == 0
+        assert len(output_csv.read_text().strip().split("\n")) == 6
+
+    def test_standardize_assume_valid(self, sample_csv, output_csv):
+        """Test canonicalization-only run without sanitization."""
+        result = run_cli([
+            "standardize",
+            "-i", str(sample_csv),
+            "-o", str(output_csv),
+            "--assume-valid",
             "-q",
         ])
         assert result.returncode == 0
+        assert "c1ccccc1" in output_csv.read_text()
+
+    def test_standardize_dedup_output_with_profile(self, tmp_dir, output_csv):
+        """Test --dedup-output and --profile together report both summaries."""
+        input_csv = tmp_dir / "dups.csv"
+        input_csv.write_text("smiles,name\nCCO,a\nOCC,b\nc1ccccc1,c\n")
+
+        result = run_cli([
+            "standardize",
+            "-i", str(input_csv),
+            "-o", str(output_csv),
+            "--dedup-output",
+            "--profile",
+            "-n", "0",
+        ], capture=True)
+        assert result.returncode == 0
+        assert "1 duplicate outputs skipped" in result.stderr
+        assert "Step timings:" in result.stderr
+        assert len(output_csv.read_text().strip().split("\n")) == 3
+
+    def test_standardize_missing_smiles_column(self, sample_csv, output_csv):
+        """Test a wrong --smiles-column fails before processing."""
+        result = run_cli([
+            "standardize",
+            "-i", str(sample_csv),
+            "-o", str(output_csv),
+            "--smiles-column", "structure",
+            "-q",
+        ], capture=True)
+        assert result.returncode == 1
+        assert "structure" in result.stderr
+        assert not output_csv.exists()
+
+    def test_standardize_missing_output_dir(self, sample_csv, tmp_dir):
+        """Test a missing output directory fails before processing."""
+        result = run_cli([
+            "standardize",
+            "-i", str(sample_csv),
+            "-o", str(tmp_dir / "missing" / "out.csv"),
+            "-q",
+        ], capture=True)
+        assert result.returncode == 1
+        assert "Output directory not found" in result.stderr
 
 
 class TestConvertCommand:
@@ -336,13 +428,13 @@ class TestHelpCommand:
 
     def test_main_help(self):
         """Test main help."""
-        result = run_cli(["--help"])
+        result = run_cli(["--help"], capture=True)
         assert result.returncode == 0
         assert "rdkit-cli" in result.stdout.lower() or "usage" in result.stdout.lower()
 
     def test_descriptors_help(self):
         """Test descriptors help."""
-        result = run_cli(["descriptors", "--help"])
+        result = run_cli(["descriptors", "--help"], capture=True)
         assert result.returncode == 0
         assert "descriptors" in result.stdout.lower()
 
@@ -361,7 +453,7 @@ class TestErrorHandling:
             "descriptors", "compute",
             "-i", "/nonexistent/file.csv",
             "-o", str(output_csv),
-        ])
+        ], capture=True)
         assert result.returncode != 0
         assert "error" in result.stderr.lower() or "not found" in result.stderr.lower()
 
@@ -546,9 +638,8 @@ class TestDepictCommand:
             "-q",
         ])
         assert result.returncode == 0
-        # Should have created some SVG files
-        svg_files = list(output_dir.glob("*.svg"))
-        assert len(svg_files) > 0
+        # Should have created some SVG files; stop at the first one
+        assert any(output_dir.glob("*.svg"))
 
     def test_depict_grid(self, sample_csv, output_svg):
         """Test grid molecule depiction."""
@@ -562,6 +653,7 @@ class TestDepictCommand:
         assert output_svg.exists()
 
 
+@pytest.mark.slow
 class TestConformersCommand:
     """Test conformers command."""
 
@@ -611,7 +703,7 @@ class TestStatsCommand:
 
     def test_stats_list_properties(self):
         """Test listing available properties."""
-        result = run_cli(["stats", "-i", "dummy.csv", "--list-properties"])
+        result = run_cli(["stats", "-i", "dummy.csv", "--list-properties"], capture=True)
         assert result.returncode == 0
         assert "MolWt" in result.stdout
 
@@ -681,7 +773,7 @@ class TestSplitCommand:
             "-q",
         ])
         assert result.returncode == 0
-        assert any("molecules" in f.name for f in output_dir.glob("*.csv"))
+        assert any(output_dir.glob("*molecules*.csv"))
 
 
 class TestSampleCommand:
@@ -759,7 +851,9 @@ class TestDeduplicateCommand:
 
     def test_deduplicate_list_keys(self):
         """Test listing available key types."""
-        result = run_cli(["deduplicate", "-i", "dummy.csv", "-o", "out.csv", "--list-keys"])
+        result = run_cli(
+            ["deduplicate", "-i", "dummy.csv", "-o", "out.csv", "--list-keys"], capture=True
+        )
         assert result.returncode == 0
         assert "smiles" in result.stdout
         assert "inchikey" in result.stdout
@@ -828,7 +922,7 @@ class TestValidateCommand:
             "-o", str(output_csv),
             "--summary",
             "-q",
-        ])
+        ], capture=True)
         assert result.returncode == 0
         assert output_csv.exists()
         # Check summary was printed
@@ -5,39 +5,54 @@ can be used as input to another.
 """
 
 import pytest
-import subprocess
-import sys
-from pathlib import Path
 
-
-def run_cli(args: list[str]) -> subprocess.CompletedProcess:
-    """Run rdkit-cli command and return result."""
-    cmd = [sys.executable, "-m", "rdkit_cli"] + args
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+from tests.integration.cli_server import run_cli
+
+
+@pytest.fixture(scope="module")
+def standardized_csv(shared_sample_csv, tmp_path_factory):
+    """Standardize the sample molecules once for every test that starts from them."""
+    standardized = tmp_path_factory.mktemp("interop") / "standardized.csv"
+    result = run_cli([
+        "standardize",
+        "-i", str(shared_sample_csv),
+        "-o", str(standardized),
+        "-q",
+    ])
+    assert result.returncode == 0
+    assert standardized.exists()
+    return standardized
+
+
+@pytest.fixture(scope="module")
+def single_cpu_descriptors(shared_sample_csv, tmp_path_factory):
+    """Compute the -n 1 descriptor reference once for every worker count."""
+    single = tmp_path_factory.mktemp("parallel") / "single.csv"
+    result = run_cli([
+        "descriptors", "compute",
+        "-i", str(shared_sample_csv),
+        "-o", str(single),
+        "-d", "MolWt,MolLogP",
+        "-n", "1",
+        "-q",
+    ])
+    assert result.returncode == 0
+    return single
 
 
 class TestStandardizeThenDescriptors:
     """Test standardize → descriptors pipeline."""
 
-    def test_standardize_then_compute_descriptors(self, sample_csv, tmp_dir):
+    def test_standardize_then_compute_descriptors(self, standardized_csv, tmp_dir):
         """Test computing descriptors on standardized molecules."""
-        standardized = tmp_dir / "standardized.csv"
         final = tmp_dir / "descriptors.csv"
 
-        # Step 1: Standardize
-        result1 = run_cli([
-            "standardize",
-            "-i", str(sample_csv),
-            "-o", str(standardized),
-            "-q",
-        ])
-        assert result1.returncode == 0
-        assert standardized.exists()
+        # Step 1 (standardize) is shared via the standardized_csv fixture
 
         # Step 2: Compute descriptors
         result2 = run_cli([
             "descriptors", "compute",
-            "-i", str(standardized),
+            "-i", str(standardized_csv),
             "-o", str(final),
             "-d", "MolWt,MolLogP,TPSA",
             "-q",
@@ -266,25 +281,17 @@ class TestDiversityPipeline:
 class TestFullPipeline:
     """Test complete processing pipeline."""
 
-    def test_standardize_filter_descriptors_fingerprints(self, sample_csv, tmp_dir):
+    def test_standardize_filter_descriptors_fingerprints(self, standardized_csv, tmp_dir):
         """Test full pipeline: standardize → filter → descriptors + fingerprints."""
-        standardized = tmp_dir / "standardized.csv"
         filtered = tmp_dir / "filtered.csv"
         final = tmp_dir / "final.csv"
 
-        # Step 1: Standardize
-        result1 = run_cli([
-            "standardize",
-            "-i", str(sample_csv),
-            "-o", str(standardized),
-            "-q",
-        ])
-        assert result1.returncode == 0
+        # Step 1 (standardize) is shared via the standardized_csv fixture
 
         # Step 2: Filter druglike
         result2 = run_cli([
             "filter", "druglike",
-            "-i", str(standardized),
+            "-i", str(standardized_csv),
             "-o", str(filtered),
             "--rule", "lipinski",
             "-q",
@@ -310,36 +317,26 @@ class TestFullPipeline:
 class TestParallelizationConsistency:
     """Test that results are consistent across parallelization settings."""
 
-    def test_descriptors_single_vs_multi_cpu(self, sample_csv, tmp_dir):
-        """Test that descriptors are same with -n 1 and -n 2."""
-        single = tmp_dir / "single.csv"
+    @pytest.mark.parametrize("ncpu", ["2", "-1"])
+    def test_descriptors_single_vs_multi_cpu(
+        self, single_cpu_descriptors, shared_sample_csv, tmp_dir, ncpu
+    ):
+        """Test that descriptors with -n 1 match those with more workers."""
         multi = tmp_dir / "multi.csv"
 
-        # Single process
-        result1 = run_cli([
+        result = run_cli([
             "descriptors", "compute",
-            "-i", str(sample_csv),
-            "-o", str(single),
-            "-d", "MolWt,MolLogP",
-            "-n", "1",
-            "-q",
-        ])
-        assert result1.returncode == 0
-
-        # Multi process
-        result2 = run_cli([
-            "descriptors", "compute",
-            "-i", str(sample_csv),
+            "-i", str(shared_sample_csv),
             "-o", str(multi),
             "-d", "MolWt,MolLogP",
-            "-n", "2",
+            "-n", ncpu,
             "-q",
         ])
-        assert result2.returncode == 0
+        assert result.returncode == 0
 
         # Compare results (order may differ due to parallelization)
         import pandas as pd
-        df1 = pd.read_csv(single).sort_values("smiles").reset_index(drop=True)
+        df1 = pd.read_csv(single_cpu_descriptors).sort_values("smiles").reset_index(drop=True)
         df2 = pd.read_csv(multi).sort_values("smiles").reset_index(drop=True)
 
         # Values should be approximately equal
@@ -1,7 +1,6 @@
 """Integration tests for new CLI commands."""
 
 import pytest
-from pathlib import Path
 
 
 class TestInfoCommand:
@@ -277,6 +276,7 @@ class TestPropsCommand:
         assert result == 0
 
 
+@pytest.mark.slow
 class TestAlignCommand:
     """Test align command."""
 
@@ -316,6 +316,7 @@ class TestAlignCommand:
         assert result == 0
 
 
+@pytest.mark.slow
 class TestRMSDCommand:
     """Test rmsd command."""
 
@@ -1,25 +1,19 @@
 """Integration tests for all new features (Phase 1/2/3).
 Tests full CLI invocation end-to-end."""
 
-import subprocess
-import sys
-from pathlib import Path
 
 import pytest
 from rdkit import Chem
 from rdkit.Chem import AllChem
 
+from tests.integration.cli_server import run_cli
 
-def run_cli(args: list[str], timeout: int = 120) -> subprocess.CompletedProcess:
-    """Run rdkit-cli command and return result."""
-    cmd = [sys.executable, "-m", "rdkit_cli"] + args
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+# Input files are built once per module and must be treated as read-only
 
-
-@pytest.fixture
-def mol_csv(tmp_path):
+@pytest.fixture(scope="module")
+def mol_csv(tmp_path_factory):
     """Standard molecule CSV."""
-    p = tmp_path / "mols.csv"
+    p = tmp_path_factory.mktemp("inputs") / "mols.csv"
     p.write_text(
         "smiles,name\n"
         "c1ccccc1,benzene\n"
@@ -31,10 +25,10 @@ def mol_csv(tmp_path):
     return p
 
 
-@pytest.fixture
-def chiral_csv(tmp_path):
+@pytest.fixture(scope="module")
+def chiral_csv(tmp_path_factory):
     """CSV with chiral molecules."""
-    p = tmp_path / "chiral.csv"
+    p = tmp_path_factory.mktemp("inputs") / "chiral.csv"
     p.write_text(
         "smiles,name\n"
         "C[C@H](O)F,chiral1\n"
@@ -44,14 +38,14 @@ def chiral_csv(tmp_path):
     return p
 
 
-@pytest.fixture
-def ref_sdf(tmp_path):
+@pytest.fixture(scope="module")
+def ref_sdf(tmp_path_factory):
     """Reference molecule SDF with 3D coords."""
     mol = Chem.MolFromSmiles("c1ccccc1")
     mol = Chem.AddHs(mol)
     AllChem.EmbedMolecule(mol, AllChem.ETKDGv3())
     AllChem.MMFFOptimizeMolecule(mol)
-    p = tmp_path / "ref.sdf"
+    p = tmp_path_factory.mktemp("inputs") / "ref.sdf"
     w = Chem.SDWriter(str(p))
     w.write(mol)
     w.close()
@@ -84,7 +78,7 @@ class TestPhase1Fingerprints:
         assert len(content.strip().split("\n")) >= 5
 
     def test_fingerprints_list_includes_new(self):
-        result = run_cli(["fingerprints", "list"])
+        result = run_cli(["fingerprints", "list"], capture=True)
         assert result.returncode == 0
         for name in ["avalon", "mhfp", "pharmacophore"]:
             assert name in result.stdout
@@ -104,6 +98,7 @@ class TestPhase1Descriptors:
         assert "MQN1" in content
         assert "MQN42" in content
 
+    @pytest.mark.slow
     def test_3d_descriptors(self, mol_csv, out):
         result = run_cli([
             "descriptors", "compute",
@@ -116,12 +111,12 @@ class TestPhase1Descriptors:
         assert "Asphericity" in content
 
     def test_list_mqn_category(self):
-        result = run_cli(["descriptors", "list", "--category", "mqn"])
+        result = run_cli(["descriptors", "list", "--category", "mqn"], capture=True)
         assert result.returncode == 0
         assert "MQN1" in result.stdout
 
     def test_list_3d_category(self):
-        result = run_cli(["descriptors", "list", "--category", "3d"])
+        result = run_cli(["descriptors", "list", "--category", "3d"], capture=True)
         assert result.returncode == 0
         assert "PMI1" in result.stdout
 
@@ -174,6 +169,7 @@ class TestPhase1Filters:
 # ===================== Phase 2: New subcommands ============================
 
 
+@pytest.mark.slow
 class TestPhase2ShapeSimilarity:
 
     def test_shape_search(self, mol_csv, ref_sdf, tmp_path):
@@ -207,7 +203,7 @@ class TestPhase2ReactionsMap:
         result = run_cli([
             "reactions", "map",
             "-s", "[C:1](=[O:2])[OH].[O:3][C:4]>>[C:1](=[O:2])[O:3][C:4]",
-        ])
+        ], capture=True)
         assert result.returncode == 0
         assert "Has mapping: True" in result.stdout
 
@@ -216,7 +212,7 @@ class TestPhase2ReactionsMap:
             "reactions", "map",
             "-s", "[C:1]=[O:2]>>[C:1][O:2]",
             "-f", "json",
-        ])
+        ], capture=True)
         assert result.returncode == 0
         import json
         data = json.loads(result.stdout)
@@ -336,6 +332,7 @@ class TestPhase3Stereo:
         assert "original_smiles" in content
 
 
+@pytest.mark.slow
 class TestPhase3Energy:
 
     def test_compute(self, mol_csv, out):
@@ -396,6 +393,7 @@ class TestPhase3DepictHighlight:
         assert "<svg" in out.read_text()
 
 
+@pytest.mark.slow
 class TestPhase3ConformersTorsion:
 
     def test_torsion_scan(self, tmp_path):
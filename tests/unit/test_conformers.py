@@ -0,0 +1,83 @@
+"""Unit tests for conformers module."""
+
+import pytest
+from rdkit import Chem
+
+
+class TestConformerGenerator:
+    """Test ConformerGenerator class."""
+
+    def test_generate(self):
+        """Test generating conformers for a molecule."""
+        from rdkit_cli.core.conformers import ConformerGenerator
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        generator = ConformerGenerator(num_conformers=3)
+        record = MoleculeRecord(mol=Chem.MolFromSmiles("CCO"), smiles="CCO", name="ethanol")
+        result = generator.generate(record)
+
+        assert result is not None
+        assert result["num_conformers"] == 3
+        assert result["mol"].GetNumConformers() == 3
+        assert "energy" in result
+
+    def test_energy_window(self):
+        """Test conformers above the energy window are dropped."""
+        from rdkit_cli.core.conformers import ConformerGenerator
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        smi = "CCCCCCOc1ccccc1C(=O)NCCN"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+
+        full = ConformerGenerator(num_conformers=20).generate(record)
+        windowed = ConformerGenerator(num_conformers=20, energy_window=2.0).generate(record)
+
+        assert windowed["energy"] == full["energy"]
+        assert 1 <= windowed["num_conformers"] < full["num_conformers"]
+        assert windowed["mol"].GetNumConformers() == windowed["num_conformers"]
+
+    def test_energy_window_best_conformer_id(self):
+        """Test best_conformer is the ID of a kept conformer with the reported energy."""
+        from rdkit.Chem import AllChem
+
+        from rdkit_cli.core.conformers import ConformerGenerator
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        smi = "CCCCCCOc1ccccc1C(=O)NCCN"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+        generator = ConformerGenerator(num_conformers=20, energy_window=2.0, random_seed=1)
+        result = generator.generate(record)
+
+        mol = result["mol"]
+        props = AllChem.MMFFGetMoleculeProperties(mol)
+        ff = AllChem.MMFFGetMoleculeForceField(mol, props, confId=result["best_conformer"])
+
+        assert ff.CalcEnergy() == pytest.approx(result["energy"], abs=0.01)
+
+    def test_prune_rms(self):
+        """Test duplicate conformers are pruned by RMSD after embedding."""
+        from rdkit_cli.core.conformers import ConformerGenerator
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        record = MoleculeRecord(mol=Chem.MolFromSmiles("c1ccccc1"), smiles="c1ccccc1")
+        result = ConformerGenerator(num_conformers=5, prune_rms=0.5).generate(record)
+
+        # Rigid benzene embeds to one distinct heavy-atom geometry
+        assert result["num_conformers"] == 1
+
+    def test_unknown_method(self):
+        """Test that an unknown embedding method raises error."""
+        from rdkit_cli.core.conformers import ConformerGenerator
+
+        with pytest.raises(ValueError, match="Unknown method"):
+            ConformerGenerator(method="nope")
+
+    def test_worker_copy_single_threaded(self):
+        """Test that unpickled copies embed on one thread inside a worker pool."""
+        import pickle
+
+        from rdkit_cli.core.conformers import ConformerGenerator
+
+        worker_copy = pickle.loads(pickle.dumps(ConformerGenerator()))
+
+        assert worker_copy.num_threads == 1
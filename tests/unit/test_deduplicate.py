@@ -143,7 +143,6 @@ class TestDeduplicator:
     def test_stream_deduplication_requires_first(self):
         """Test that stream deduplication requires keep='first'."""
         from rdkit_cli.core.deduplicate import Deduplicator
-        from rdkit_cli.io.readers import MoleculeRecord
 
         dedup = Deduplicator(key_type="smiles", keep="last")
 
@@ -72,6 +72,24 @@ class TestDescriptorCalculator:
         result = calc.compute(record)
         assert result is None
 
+    def test_matches_compute_descriptor(self, sample_molecules):
+        """Test that batched MQN evaluation matches per-descriptor calls."""
+        from rdkit_cli.core.descriptors import (
+            MQN_DESCRIPTORS,
+            DescriptorCalculator,
+            compute_descriptor,
+        )
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        descriptors = ["MolWt", "TPSA"] + MQN_DESCRIPTORS
+        calc = DescriptorCalculator(descriptors=descriptors, precision=6)
+
+        for name, smi in sample_molecules:
+            mol = Chem.MolFromSmiles(smi)
+            result = calc.compute(MoleculeRecord(mol=mol, smiles=smi, name=name))
+            for desc in descriptors:
+                assert result[desc] == round(compute_descriptor(mol, desc), 6)
+
 
 class TestListDescriptors:
     """Test list_descriptors function."""
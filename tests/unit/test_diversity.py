@@ -59,6 +59,24 @@ class TestDiversityPicker:
         # Selected indices should be from valid molecules
         assert all(mols[idx] is not None for idx in selected)
 
+    def test_pick_with_first_picks(self):
+        """Test required picks are mapped past None molecules and kept first."""
+        from rdkit_cli.core.diversity import DiversityPicker
+
+        mols = [
+            Chem.MolFromSmiles("c1ccccc1"),
+            None,
+            Chem.MolFromSmiles("CCCCCC"),
+            Chem.MolFromSmiles("CCO"),
+            Chem.MolFromSmiles("Cc1ccccc1"),
+        ]
+
+        picker = DiversityPicker(n_picks=3)
+        selected = picker.pick(mols, first_picks=[4, 1, 2])
+
+        assert selected[:2] == [4, 2]
+        assert len(selected) == 3
+
     def test_empty_input(self):
         """Test empty molecule list."""
         from rdkit_cli.core.diversity import DiversityPicker
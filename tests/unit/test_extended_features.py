@@ -409,12 +409,12 @@ class TestFilterAlertCatalogs:
         pains_filt = PAINSFilter(catalog_name="pains")
         assert filt.catalog.GetNumEntries() > pains_filt.catalog.GetNumEntries()
 
-    def test_pains_a_b_c_catalogs(self):
+    @pytest.mark.parametrize("cat", ["pains_a", "pains_b", "pains_c"])
+    def test_pains_a_b_c_catalogs(self, cat):
         from rdkit_cli.core.filters import PAINSFilter
 
-        for cat in ["pains_a", "pains_b", "pains_c"]:
-            filt = PAINSFilter(catalog_name=cat)
-            assert filt.catalog.GetNumEntries() > 0
+        filt = PAINSFilter(catalog_name=cat)
+        assert filt.catalog.GetNumEntries() > 0
 
     def test_invalid_catalog_raises(self):
         from rdkit_cli.core.filters import PAINSFilter
@@ -163,6 +163,22 @@ class TestPropertyFilter:
         result = filt.filter(record)
         assert result is not None
 
+    def test_cheap_rule_checked_first(self, monkeypatch):
+        """Test an expensive descriptor is skipped when a cheaper rule already fails."""
+        from rdkit.Chem import Descriptors
+
+        from rdkit_cli.core.filters import PropertyFilter
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        calls = []
+        monkeypatch.setattr(Descriptors, "MolLogP", lambda mol: calls.append(mol) or 0.0)
+
+        filt = PropertyFilter(rules={"MolLogP": (None, 5), "MolWt": (None, 50)})
+        record = MoleculeRecord(mol=Chem.MolFromSmiles("c1ccccc1O"), smiles="c1ccccc1O")
+
+        assert filt.filter(record) is None
+        assert calls == []
+
 
 class TestPAINSFilter:
     """Test PAINSFilter class."""
@@ -527,3 +543,9 @@ class TestPAINSFilterExcludeMode:
         filt_keep = PAINSFilter(exclude=False)
         result = filt_keep.filter(record)
         assert result is not None  # PAINS hit is kept
+
+    def test_catalog_shared(self):
+        """Test filters on the same catalog share one instance."""
+        from rdkit_cli.core.filters import PAINSFilter
+
+        assert PAINSFilter().catalog is PAINSFilter(exclude=False).catalog
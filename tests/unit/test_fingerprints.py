@@ -67,6 +67,77 @@ class TestFingerprintCalculator:
         result = calc.compute(record)
         assert result is None
 
+    def test_shared_generator_matches_fresh(self):
+        """Test the calculator's cached generator gives the same bits as a fresh one."""
+        from rdkit_cli.core.fingerprints import (
+            FingerprintCalculator,
+            FingerprintType,
+            compute_fingerprint,
+        )
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        mol = Chem.MolFromSmiles("CC(=O)Oc1ccccc1C(=O)O")
+        calc = FingerprintCalculator(fp_type=FingerprintType.MORGAN, n_bits=1024)
+        fp = compute_fingerprint(mol, FingerprintType.MORGAN, n_bits=1024)
+
+        for _ in range(2):
+            result = calc.compute(MoleculeRecord(mol=mol, smiles="x"))
+            assert result["fingerprint"] == fp.ToBase64()
+
+    @pytest.mark.parametrize("fp_type", ["morgan", "maccs", "rdkit", "atompair", "torsion",
+                                         "pattern", "avalon", "mhfp", "pharmacophore"])
+    def test_every_type_computes(self, fp_type):
+        """Test every fingerprint type has a working per-molecule function."""
+        from rdkit_cli.core.fingerprints import FingerprintType, compute_fingerprint
+
+        mol = Chem.MolFromSmiles("CC(=O)Oc1ccccc1C(=O)O")
+        fp_type = FingerprintType(fp_type)
+
+        assert compute_fingerprint(mol, fp_type, n_bits=1024, radius=2) is not None
+
+    def test_bits_format(self):
+        """Test per-bit columns match the fingerprint's bit string."""
+        from rdkit_cli.core.fingerprints import (
+            FingerprintCalculator,
+            FingerprintType,
+            compute_fingerprint,
+        )
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        mol = Chem.MolFromSmiles("c1ccccc1O")
+        calc = FingerprintCalculator(
+            fp_type=FingerprintType.MORGAN, n_bits=64, output_format="bits"
+        )
+        result = calc.compute(MoleculeRecord(mol=mol, smiles="c1ccccc1O"))
+        expected = compute_fingerprint(mol, FingerprintType.MORGAN, n_bits=64).ToBitString()
+
+        bit_cols = [c for c in calc.get_column_names() if c.startswith("bit_")]
+        assert "".join(str(result[c]) for c in bit_cols) == expected
+
+    def test_numpy_format(self):
+        """Test numpy output packs the fingerprint's bits into uint8 bytes."""
+        import numpy as np
+
+        from rdkit_cli.core.fingerprints import (
+            FingerprintCalculator,
+            FingerprintType,
+            compute_fingerprint,
+        )
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        mol = Chem.MolFromSmiles("c1ccccc1O")
+        calc = FingerprintCalculator(
+            fp_type=FingerprintType.MACCS, output_format="numpy"
+        )
+        result = calc.compute(MoleculeRecord(mol=mol, smiles="c1ccccc1O"))
+        expected = compute_fingerprint(mol, FingerprintType.MACCS).ToBitString()
+
+        packed = result["fingerprint"]
+        assert packed.dtype == np.uint8
+        assert packed.shape == (21,)
+        bits = np.unpackbits(packed)[:calc.n_bits]
+        assert "".join(map(str, bits)) == expected
+
 
 class TestListFingerprints:
     """Test list_fingerprints function."""
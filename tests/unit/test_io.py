@@ -84,6 +84,70 @@ class TestSMIReader:
         assert len(records) == 5
         assert records[0].smiles is not None
 
+    def test_len_without_trailing_newline(self, tmp_dir):
+        """Test the line count includes a last line with no newline."""
+        from rdkit_cli.io.readers import SMIReader
+
+        smi_path = tmp_dir / "no_newline.smi"
+        smi_path.write_text("CCO a\nc1ccccc1 b")
+
+        assert len(SMIReader(smi_path)) == 2
+        assert len(list(SMIReader(smi_path))) == 2
+
+    def test_iteration_streams(self, tmp_dir):
+        """Test reading does not hold the whole file in memory."""
+        import tracemalloc
+
+        from rdkit_cli.io.readers import SMIReader
+
+        smi_path = tmp_dir / "large.smi"
+        smi_path.write_text("CCO ethanol\n" * 20000)
+
+        tracemalloc.start()
+        try:
+            n = sum(1 for _ in SMIReader(smi_path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert n == 20000
+        # Holding every record would take well over 10 MB of Python objects
+        assert peak < 4 << 20
+
+    def test_split_matches_full_read(self, tmp_dir):
+        """Test byte-range shards cover every line once, in order."""
+        from rdkit_cli.io.readers import SMIReader
+
+        smi_path = tmp_dir / "many.smi"
+        smi_path.write_text("".join(f"{'C' * (i % 7 + 1)} mol{i}\n" for i in range(50)))
+
+        reader = SMIReader(smi_path)
+        shards = reader.split(4)
+
+        assert len(shards) == 4
+        full = [(r.name, r.row_idx) for r in reader]
+        sharded = [(r.name, r.row_idx) for shard in shards for r in shard]
+        assert sharded == full
+        assert sum(len(shard) for shard in shards) == 50
+
+
+class TestUniqueSmilesReader:
+    """Test input SMILES deduplicating reader."""
+
+    def test_skips_repeated_smiles(self, tmp_dir):
+        """Test exact repeats are skipped and counted."""
+        from rdkit_cli.io.readers import SMIReader, UniqueSmilesReader
+
+        smi_path = tmp_dir / "dups.smi"
+        smi_path.write_text("CCO a\nc1ccccc1 b\nCCO c\nOCC d\n")
+
+        reader = UniqueSmilesReader(SMIReader(smi_path))
+        with reader:
+            names = [record.name for record in reader]
+
+        assert names == ["a", "b", "d"]
+        assert reader.n_duplicates == 1
+
 
 class TestCSVWriter:
     """Test CSV writer."""
@@ -139,6 +203,97 @@ class TestSMIWriter:
         content = output_smi.read_text()
         assert "CCO" in content
 
+    def test_write_batch_skips_empty(self, output_smi):
+        """Test batch writing skips rows without SMILES."""
+        from rdkit_cli.io.writers import create_writer
+
+        writer = create_writer(output_smi)
+
+        with writer:
+            writer.write_batch([
+                {"smiles": "CCO", "name": "ethanol"},
+                {"smiles": "", "name": "empty"},
+                {"smiles": "C"},
+            ])
+
+        assert output_smi.read_text() == "CCO ethanol\nC\n"
+
+
+class TestParquetWriter:
+    """Test Parquet writer."""
+
+    def test_write_multiple_row_groups(self, tmp_dir):
+        """Test batches flushed as separate row groups read back in order."""
+        import pandas as pd
+
+        from rdkit_cli.io.writers import ParquetWriter
+
+        output = tmp_dir / "out.parquet"
+        output.write_bytes(b"stale")
+
+        writer = ParquetWriter(output, columns=["smiles", "MolWt"])
+        writer._batch_size = 2
+
+        with writer:
+            writer.write_batch([{"MolWt": 16.0, "smiles": "C"}, {"MolWt": 30.1, "smiles": "CC"}])
+            writer.write_row({"MolWt": 44.1, "smiles": "CCC", "mol": object()})
+
+        df = pd.read_parquet(output)
+        assert df.columns.tolist() == ["smiles", "MolWt"]
+        assert df["smiles"].tolist() == ["C", "CC", "CCC"]
+        assert df["MolWt"].tolist() == [16.0, 30.1, 44.1]
+
+
+class TestNpzWriter:
+    """Test NumPy archive writer."""
+
+    def test_write_packed_rows(self, tmp_dir):
+        """Test rows are stacked into one array per column."""
+        import numpy as np
+
+        from rdkit_cli.io.writers import NpzWriter
+
+        output = tmp_dir / "fps.npz"
+        writer = NpzWriter(output, columns=["smiles", "name", "fingerprint"], attrs={"n_bits": 16})
+
+        with writer:
+            writer.write_batch([
+                {
+                    "smiles": "CCO",
+                    "name": "ethanol",
+                    "fingerprint": np.array([1, 2], dtype=np.uint8),
+                },
+                {"smiles": "C", "fingerprint": np.array([3, 4], dtype=np.uint8)},
+            ])
+
+        data = np.load(output)
+        assert data["fingerprint"].tolist() == [[1, 2], [3, 4]]
+        assert data["smiles"].tolist() == ["CCO", "C"]
+        assert data["name"].tolist() == ["ethanol", ""]
+        assert data["n_bits"] == 16
+
+
+class TestUniqueKeyWriter:
+    """Test key-deduplicating writer."""
+
+    def test_drops_repeated_keys(self, output_csv):
+        """Test rows with an already-written key are dropped and counted."""
+        from rdkit_cli.io.writers import UniqueKeyWriter, create_writer
+
+        writer = UniqueKeyWriter(create_writer(output_csv), key_column="key")
+
+        with writer:
+            writer.write_batch([
+                {"smiles": "CCO", "key": "A"},
+                {"smiles": "OCC", "key": "A"},
+                {"smiles": "C", "key": ""},
+            ])
+            writer.write_row({"smiles": "c1ccccc1", "key": "B"})
+
+        lines = output_csv.read_text().strip().split("\n")
+        assert lines[1:] == ["CCO,A", "C,", "c1ccccc1,B"]
+        assert writer.n_duplicates == 1
+
 
 class TestMoleculeRecord:
     """Test MoleculeRecord class."""
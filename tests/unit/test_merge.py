@@ -1,7 +1,6 @@
 """Unit tests for merge module."""
 
 import pytest
-from pathlib import Path
 
 
 class TestMoleculeMerger:
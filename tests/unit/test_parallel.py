@@ -0,0 +1,83 @@
+"""Unit tests for parallel module."""
+
+import pickle
+
+import pytest
+from rdkit import Chem
+
+
+def _make_engine(name):
+    """Build an engine and the method that processes one record."""
+    from rdkit_cli.core.conformers import ConformerGenerator
+    from rdkit_cli.core.descriptors import DescriptorCalculator
+    from rdkit_cli.core.filters import DruglikeFilter, PAINSFilter, PropertyFilter
+    from rdkit_cli.core.fingerprints import FingerprintCalculator, FingerprintType
+    from rdkit_cli.core.standardizer import MoleculeStandardizer
+
+    engines = {
+        "standardizer": (lambda: MoleculeStandardizer(fragment_parent=True), "standardize"),
+        "fingerprints": (
+            lambda: FingerprintCalculator(fp_type=FingerprintType.ATOMPAIR, n_bits=512),
+            "compute",
+        ),
+        "descriptors": (DescriptorCalculator, "compute"),
+        "conformers": (lambda: ConformerGenerator(num_conformers=2, random_seed=7), "generate"),
+        "property_filter": (lambda: PropertyFilter(rules={"MolWt": (None, 500)}), "filter"),
+        "druglike_filter": (lambda: DruglikeFilter(rule_name="veber"), "filter"),
+        "pains_filter": (lambda: PAINSFilter(exclude=False), "filter"),
+    }
+    factory, method = engines[name]
+    return factory(), method
+
+
+def _comparable(result):
+    """Drop molecule objects, which only compare equal by identity."""
+    return {k: v for k, v in result.items() if not isinstance(v, Chem.Mol)}
+
+
+class TestRebuildOnUnpickle:
+    """Test RebuildOnUnpickle engines."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "standardizer",
+            "fingerprints",
+            "descriptors",
+            "conformers",
+            "property_filter",
+            "druglike_filter",
+            "pains_filter",
+        ],
+    )
+    def test_pickle_roundtrip(self, name):
+        """Test that a worker copy gives the same result as the original engine."""
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        engine, method = _make_engine(name)
+        clone = pickle.loads(pickle.dumps(engine))
+
+        smi = "O=C1NC(=S)SC1.[Na+]"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+        expected = getattr(engine, method)(record)
+
+        assert expected is not None
+        assert _comparable(getattr(clone, method)(record)) == _comparable(expected)
+
+
+class TestGetWorkerCount:
+    """Test get_worker_count function."""
+
+    def test_zero_runs_in_process(self):
+        """Test that 0 requests a single in-process worker."""
+        from rdkit_cli.parallel.executor import get_worker_count
+
+        assert get_worker_count(0) == 1
+
+    def test_negative_uses_all_cores(self):
+        """Test that -1 requests every core."""
+        import os
+
+        from rdkit_cli.parallel.executor import get_worker_count
+
+        assert get_worker_count(-1) == (os.cpu_count() or 1)
@@ -81,6 +81,20 @@ class TestConformerRMSDMatrix:
             for j in range(i + 1, n_conf):
                 assert abs(matrix[i][j] - matrix[j][i]) < 0.001
 
+    @pytest.mark.parametrize("symmetry", [True, False])
+    def test_matrix_matches_rdkit(self, mol_with_conformers, symmetry):
+        """Test the batched matrix matches per-pair GetConformerRMS."""
+        from rdkit_cli.core.rmsd import calculate_conformer_rmsd_matrix
+
+        matrix = calculate_conformer_rmsd_matrix(mol_with_conformers, symmetry=symmetry)
+
+        mol = Chem.Mol(mol_with_conformers)
+        n_conf = mol.GetNumConformers()
+        for i in range(n_conf):
+            for j in range(i + 1, n_conf):
+                expected = AllChem.GetConformerRMS(mol, i, j, prealigned=not symmetry)
+                assert matrix[i][j] == pytest.approx(expected, abs=1e-6)
+
     def test_matrix_no_conformers(self):
         """Test with molecule without conformers."""
         from rdkit_cli.core.rmsd import calculate_conformer_rmsd_matrix
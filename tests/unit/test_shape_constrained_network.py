@@ -1,8 +1,6 @@
 """Tests for new subcommands: shape similarity, constrained embedding,
 reaction mapping, scaffold network, charges/crippen, BRICS build."""
 
-import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -28,6 +26,14 @@ def _make_3d_sdf(smiles: str, path: Path):
     writer.close()
 
 
+@pytest.fixture(scope="module")
+def benzene_ref_sdf(tmp_path_factory):
+    """Benzene reference SDF with 3D coords, shared read-only by the module."""
+    path = tmp_path_factory.mktemp("inputs") / "ref.sdf"
+    _make_3d_sdf("c1ccccc1", path)
+    return path
+
+
 # ---------------------------------------------------------------------------
 # 1. Shape similarity
 # ---------------------------------------------------------------------------
@@ -35,14 +41,11 @@ def _make_3d_sdf(smiles: str, path: Path):
 
 class TestShapeSimilaritySearcher:
 
-    def test_shape_search_self(self, tmp_path):
+    def test_shape_search_self(self, benzene_ref_sdf):
         from rdkit_cli.core.similarity import ShapeSimilaritySearcher
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         searcher = ShapeSimilaritySearcher(
-            reference_file=str(ref_path),
+            reference_file=str(benzene_ref_sdf),
             threshold=0.0,
             metric="tanimoto",
         )
@@ -52,14 +55,11 @@ class TestShapeSimilaritySearcher:
         assert "shape_similarity" in result
         assert result["shape_similarity"] > 0
 
-    def test_shape_search_protrude(self, tmp_path):
+    def test_shape_search_protrude(self, benzene_ref_sdf):
         from rdkit_cli.core.similarity import ShapeSimilaritySearcher
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         searcher = ShapeSimilaritySearcher(
-            reference_file=str(ref_path),
+            reference_file=str(benzene_ref_sdf),
             threshold=0.0,
             metric="protrude",
         )
@@ -67,14 +67,11 @@ class TestShapeSimilaritySearcher:
         assert result is not None
         assert isinstance(result["shape_similarity"], float)
 
-    def test_shape_search_tversky(self, tmp_path):
+    def test_shape_search_tversky(self, benzene_ref_sdf):
         from rdkit_cli.core.similarity import ShapeSimilaritySearcher
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         searcher = ShapeSimilaritySearcher(
-            reference_file=str(ref_path),
+            reference_file=str(benzene_ref_sdf),
             threshold=0.0,
             metric="tversky",
             tversky_alpha=0.8,
@@ -83,14 +80,11 @@ class TestShapeSimilaritySearcher:
         result = searcher.search(_make_record("c1ccccc1", "benzene"))
         assert result is not None
 
-    def test_shape_threshold_filters(self, tmp_path):
+    def test_shape_threshold_filters(self, benzene_ref_sdf):
         from rdkit_cli.core.similarity import ShapeSimilaritySearcher
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         searcher = ShapeSimilaritySearcher(
-            reference_file=str(ref_path),
+            reference_file=str(benzene_ref_sdf),
             threshold=0.99,
         )
         # Methane is very different from benzene in shape
@@ -109,14 +103,11 @@ class TestShapeSimilaritySearcher:
         with pytest.raises(ValueError, match="Cannot load"):
             ShapeSimilaritySearcher(reference_file=str(bad_path))
 
-    def test_shape_none_molecule(self, tmp_path):
+    def test_shape_none_molecule(self, benzene_ref_sdf):
         from rdkit_cli.core.similarity import ShapeSimilaritySearcher
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         searcher = ShapeSimilaritySearcher(
-            reference_file=str(ref_path), threshold=0.0,
+            reference_file=str(benzene_ref_sdf), threshold=0.0,
         )
         record = MoleculeRecord(mol=None, smiles="invalid")
         assert searcher.search(record) is None
@@ -129,14 +120,11 @@ class TestShapeSimilaritySearcher:
 
 class TestConstrainedEmbedder:
 
-    def test_constrained_embed(self, tmp_path):
+    def test_constrained_embed(self, benzene_ref_sdf):
         from rdkit_cli.core.conformers import ConstrainedEmbedder
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
         embedder = ConstrainedEmbedder(
-            reference_file=str(ref_path),
+            reference_file=str(benzene_ref_sdf),
             force_field="mmff",
         )
         # Phenol contains benzene as substructure
@@ -146,13 +134,10 @@ class TestConstrainedEmbedder:
         assert "mol" in result
         assert result["mol"].GetNumConformers() > 0
 
-    def test_constrained_embed_none_mol(self, tmp_path):
+    def test_constrained_embed_none_mol(self, benzene_ref_sdf):
         from rdkit_cli.core.conformers import ConstrainedEmbedder
 
-        ref_path = tmp_path / "ref.sdf"
-        _make_3d_sdf("c1ccccc1", ref_path)
-
-        embedder = ConstrainedEmbedder(reference_file=str(ref_path))
+        embedder = ConstrainedEmbedder(reference_file=str(benzene_ref_sdf))
         record = MoleculeRecord(mol=None, smiles="invalid")
         assert embedder.embed(record) is None
 
@@ -107,6 +107,49 @@ class TestComputeSimilarity:
         similarity = compute_similarity(fp1, fp2, SimilarityMetric.TANIMOTO)
         assert 0 <= similarity < 1
 
+    def test_batch_fingerprints_match_single(self):
+        """Test batch Morgan fingerprints match per-molecule ones."""
+        from rdkit_cli.core.similarity import get_morgan_fingerprint, get_morgan_fingerprints
+
+        mols = [Chem.MolFromSmiles(s) for s in ["CCO", "c1ccccc1O", "CC(=O)Nc1ccccc1"]]
+
+        fps = get_morgan_fingerprints(mols, radius=3, n_bits=1024)
+
+        assert fps == [get_morgan_fingerprint(mol, radius=3, n_bits=1024) for mol in mols]
+
+
+class TestPackedTanimoto:
+    """Test bit-packed Tanimoto similarity."""
+
+    @pytest.mark.parametrize("bitwise_count", [True, False])
+    def test_matches_bulk_tanimoto(self, monkeypatch, bitwise_count):
+        """Test packed similarities equal RDKit's, including empty fingerprints."""
+        import numpy as np
+        from rdkit import DataStructs
+
+        from rdkit_cli.core.similarity import (
+            count_bits,
+            get_morgan_fingerprints,
+            pack_fingerprints,
+            packed_tanimoto_similarity,
+        )
+
+        if not bitwise_count:
+            monkeypatch.delattr(np, "bitwise_count", raising=False)
+
+        mols = [Chem.MolFromSmiles(s) for s in ["CCO", "c1ccccc1O", "CC(=O)Nc1ccccc1"]]
+        fps = get_morgan_fingerprints(mols, n_bits=100)
+        fps += [DataStructs.ExplicitBitVect(100), DataStructs.ExplicitBitVect(100)]
+
+        packed = pack_fingerprints(fps)
+        counts = count_bits(packed)
+
+        assert packed.shape == (5, 2)
+        assert counts.tolist() == [fp.GetNumOnBits() for fp in fps]
+        for i, fp in enumerate(fps):
+            sims = packed_tanimoto_similarity(packed[i], packed, counts[i], counts)
+            assert sims.tolist() == list(DataStructs.BulkTanimotoSimilarity(fp, fps))
+
 
 class TestComputeSimilarityMatrix:
     """Test compute_similarity_matrix function."""
@@ -142,6 +185,8 @@ class TestComputeSimilarityMatrix:
 
     def test_matrix_symmetry(self):
         """Test matrix is symmetric."""
+        import numpy as np
+
         from rdkit_cli.core.similarity import compute_similarity_matrix
 
         mols = [
@@ -150,11 +195,33 @@ class TestComputeSimilarityMatrix:
             Chem.MolFromSmiles("c1ccccc1"),
         ]
 
-        matrix = compute_similarity_matrix(mols)
-
-        for i in range(len(matrix)):
-            for j in range(len(matrix)):
-                assert matrix[i][j] == matrix[j][i]
+        matrix = np.array(compute_similarity_matrix(mols))
+
+        assert np.array_equal(matrix, matrix.T)
+
+    @pytest.mark.parametrize("metric", ["tanimoto", "dice", "cosine", "tversky", "rogotgoldberg"])
+    def test_matrix_matches_pairwise(self, metric):
+        """Test bulk row computation matches per-pair similarity."""
+        from rdkit_cli.core.similarity import (
+            SimilarityMetric,
+            compute_similarity,
+            compute_similarity_matrix,
+            get_morgan_fingerprint,
+        )
+
+        mols = [Chem.MolFromSmiles(s) for s in ["CCO", "c1ccccc1O", "CC(=O)Nc1ccccc1", "CCN"]]
+        metric = SimilarityMetric(metric)
+
+        matrix = compute_similarity_matrix(mols, metric=metric, tversky_alpha=0.7, tversky_beta=0.3)
+
+        fps = [get_morgan_fingerprint(mol) for mol in mols]
+        for i in range(len(mols)):
+            for j in range(i + 1, len(mols)):
+                expected = compute_similarity(
+                    fps[i], fps[j], metric, tversky_alpha=0.7, tversky_beta=0.3
+                )
+                assert matrix[i][j] == expected
+                assert matrix[j][i] == expected
 
 
 class TestClusterMolecules:
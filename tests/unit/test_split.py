@@ -99,3 +99,29 @@ class TestFileSplitter:
 
         # Should only create 3 chunks (one per record)
         assert len(assignments) == 3
+
+
+class TestRunSplit:
+    """Test the split command's chunk writing."""
+
+    @pytest.mark.parametrize("fmt", ["csv", "sdf"])
+    def test_parallel_matches_serial(self, monkeypatch, sample_csv, tmp_dir, fmt):
+        """Test chunks written by worker threads match the serial output."""
+        import os
+
+        from rdkit_cli.cli import create_parser
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+        outputs = {}
+        for ncpu in ("1", "4"):
+            out_dir = tmp_dir / f"out_{ncpu}"
+            args = create_parser().parse_args([
+                "split", "-i", str(sample_csv), "-o", str(out_dir),
+                "-s", "2", "--format", fmt, "-n", ncpu, "-q",
+            ])
+            assert args.func(args) == 0
+            outputs[ncpu] = {p.name: p.read_text() for p in out_dir.iterdir()}
+
+        assert len(outputs["1"]) >= 2
+        assert outputs["4"] == outputs["1"]
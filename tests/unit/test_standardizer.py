@@ -90,6 +90,88 @@ class TestMoleculeStandardizer:
         assert "original_smiles" in result
         assert result["original_smiles"] == smi
 
+    def test_kekule_form(self):
+        """Test Kekule output form."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        std = MoleculeStandardizer(canonical_form="kekule")
+
+        smi = "c1ccccc1O"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi, name="phenol")
+        result = std.standardize(record)
+
+        assert result is not None
+        assert "c" not in result["smiles"]
+        assert Chem.CanonSmiles(result["smiles"]) == "Oc1ccccc1"
+
+    def test_inchi_form_order_independent(self):
+        """Test InChI-derived form is independent of input atom order."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        std = MoleculeStandardizer(canonical_form="inchi", tautomer_parent=True)
+
+        outputs = set()
+        for smi in ["Oc1ncccc1", "c1ccnc(O)c1", "O=c1cccc[nH]1"]:
+            record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+            result = std.standardize(record)
+            assert result is not None
+            outputs.add(result["smiles"])
+
+        assert len(outputs) == 1
+
+    def test_invalid_canonical_form(self):
+        """Test unknown canonical form raises."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+
+        with pytest.raises(ValueError):
+            MoleculeStandardizer(canonical_form="inchikey")
+
+    def test_passthrough_without_transforms(self):
+        """Test input SMILES pass through when nothing is enabled."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        std = MoleculeStandardizer(canonicalize=False)
+        assert not std.has_transforms
+
+        smi = "C(C)(C)C"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi, name="isobutane")
+        result = std.standardize(record)
+
+        assert result == {"smiles": smi, "name": "isobutane"}
+
+    def test_add_inchikey(self):
+        """Test InChIKey of the standardized molecule is added."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        std = MoleculeStandardizer(uncharge=True, add_inchikey=True)
+        assert std.get_column_names()[-1] == "inchikey"
+
+        smi = "CC(=O)[O-]"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+        result = std.standardize(record)
+
+        assert result is not None
+        assert result["inchikey"] == Chem.MolToInchiKey(Chem.MolFromSmiles("CC(=O)O"))
+
+    def test_profile_timings(self):
+        """Test per-step timings are reported when profiling."""
+        from rdkit_cli.core.standardizer import MoleculeStandardizer
+        from rdkit_cli.io.readers import MoleculeRecord
+
+        std = MoleculeStandardizer(uncharge=True, fragment_parent=True, profile=True)
+
+        smi = "CC(=O)[O-].[Na+]"
+        record = MoleculeRecord(mol=Chem.MolFromSmiles(smi), smiles=smi)
+        result = std.standardize(record)
+
+        assert result is not None
+        assert set(result["_timings"]) == {"uncharge", "fragment_parent", "output"}
+        assert all(value >= 0 for value in result["_timings"].values())
+
     def test_none_molecule(self):
         """Test handling of None molecule."""
         from rdkit_cli.core.standardizer import MoleculeStandardizer
@@ -2,9 +2,7 @@
 conformers torsion, and reactions fingerprint."""
 
 import pytest
-from pathlib import Path
 from rdkit import Chem
-from rdkit.Chem import AllChem
 
 from rdkit_cli.io.readers import MoleculeRecord
 